@@ -11,7 +11,7 @@ Endpoints:
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Mapping, Optional, cast
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field
@@ -578,20 +578,19 @@ async def get_service_mappings():
                 cost_assumptions=cost.get("assumptions") if isinstance(cost, dict) else None,
             ))
         gcp_mappings = []
-        for entry in GCP_TO_AZURE_MAPPINGS:
-            entry_map = cast(Dict[str, Any], entry)
+        # GCP mappings are keyed by service name and hold read-only entries
+        for gcp_service, entry_map in GCP_TO_AZURE_MAPPINGS.items():
             cost = entry_map.get("cost", {})
-            gcp_aliases = entry_map.get("gcp") or []
             gcp_mappings.append(ServiceMappingResponse(
-                source_service=gcp_aliases[0] if gcp_aliases else "",
-                source_aliases=gcp_aliases,
+                source_service=gcp_service,
+                source_aliases=[gcp_service],
                 target_service=entry_map.get("azure_service", ""),
                 target_resource_type=entry_map.get("azure_resource_type", ""),
                 category=entry_map.get("azure_category", ""),
                 description=entry_map.get("description", ""),
                 aws_monthly_cost=None,
-                azure_monthly_cost=cost.get("azure_monthly") if isinstance(cost, dict) else None,
-                cost_assumptions=cost.get("assumptions") if isinstance(cost, dict) else None,
+                azure_monthly_cost=cost.get("azure_monthly") if isinstance(cost, Mapping) else None,
+                cost_assumptions=cost.get("assumptions") if isinstance(cost, Mapping) else None,
             ))
 
         
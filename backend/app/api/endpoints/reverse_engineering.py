@@ -7,7 +7,7 @@ Endpoints:
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -222,7 +222,7 @@ async def reverse_import(request: ReverseImportRequest):
             warnings=warnings,
             errors=errors,
             source_provider=provider,
-            import_timestamp=datetime.utcnow(),
+            import_timestamp=datetime.now(timezone.utc),
         )
         
         logger.info(
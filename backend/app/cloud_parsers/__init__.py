@@ -5,13 +5,18 @@ Provides functions to normalize cloud inventory JSON into InfraGraph format:
 - normalize_azure: Parse Azure resource exports
 - normalize_aws: Parse AWS inventory/CloudFormation exports
 - normalize_gcp: Parse GCP resource manager exports
+- normalize_aws_stream / normalize_gcp_stream: Incrementally parse large
+  AWS/GCP exports from a file (requires ijson)
 """
 
 from .parsers import (
     normalize_azure,
     normalize_aws,
     normalize_gcp,
+    normalize_aws_stream,
+    normalize_gcp_stream,
     detect_provider,
+    detect_provider_stream,
     parse_inventory,
 )
 
@@ -19,6 +24,9 @@ __all__ = [
     "normalize_azure",
     "normalize_aws",
     "normalize_gcp",
+    "normalize_aws_stream",
+    "normalize_gcp_stream",
     "detect_provider",
+    "detect_provider_stream",
     "parse_inventory",
 ]
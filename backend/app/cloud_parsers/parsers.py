@@ -12,11 +12,14 @@ InfraNode/InfraEdge structures that can be used for migration planning,
 compliance analysis, and cost optimization.
 """
 
+import json
 import logging
+import os
 import re
-import uuid
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from ..models.infra_models import (
     CloudProvider,
@@ -144,17 +147,6 @@ GCP_ICON_PATHS: Dict[str, str] = {
 }
 
 
-def _get_icon_path(service_type: str, provider: CloudProvider) -> Optional[str]:
-    """Get the icon path for a service type and provider."""
-    if provider == CloudProvider.AWS:
-        return AWS_ICON_PATHS.get(service_type)
-    elif provider == CloudProvider.AZURE:
-        return AZURE_ICON_PATHS.get(service_type)
-    elif provider == CloudProvider.GCP:
-        return GCP_ICON_PATHS.get(service_type)
-    return None
-
-
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
@@ -171,20 +163,17 @@ def _convert_aws_tags(tags: Any) -> Dict[str, str]:
     Returns:
         Dictionary of tag key-value pairs
     """
-    if tags is None:
+    if not tags:
         return {}
     if isinstance(tags, dict):
         return tags
     if isinstance(tags, list):
-        result = {}
-        for tag in tags:
-            if isinstance(tag, dict):
-                # Handle {Key: x, Value: y} format
-                key = tag.get("Key") or tag.get("key") or tag.get("Name")
-                value = tag.get("Value") or tag.get("value") or ""
-                if key:
-                    result[key] = value
-        return result
+        # Handle {Key: x, Value: y} format (and its lowercase/Name variants)
+        return {
+            key: _pick(tag, _AWS_TAG_VALUE_KEYS, "")
+            for tag in tags
+            if isinstance(tag, dict) and (key := _pick(tag, _AWS_TAG_KEY_KEYS))
+        }
     return {}
 
 
@@ -304,53 +293,107 @@ GCP_SERVICE_TYPES: Dict[str, Tuple[str, str]] = {
     "aiplatform.googleapis.com/endpoint": ("vertex_ai", "AI"),
 }
 
+_SERVICE_TYPES_BY_PROVIDER: Dict[CloudProvider, Dict[str, Tuple[str, str]]] = {
+    CloudProvider.AZURE: AZURE_SERVICE_TYPES,
+    CloudProvider.AWS: AWS_SERVICE_TYPES,
+    CloudProvider.GCP: GCP_SERVICE_TYPES,
+}
+
+# All providers' mappings in one table keyed by (provider, lowercase raw type),
+# so exact matches are a single probe with no per-provider branching.
+_ALL_SERVICE_TYPES: Dict[Tuple[CloudProvider, str], Tuple[str, str]] = {
+    (provider, raw_type): mapping
+    for provider, service_types in _SERVICE_TYPES_BY_PROVIDER.items()
+    for raw_type, mapping in service_types.items()
+}
+
 
 # -----------------------------------------------------------------------------
 # Helper Functions
 # -----------------------------------------------------------------------------
 
+# Field names probed (in priority order) across the supported export formats
+_AWS_TYPE_KEYS: Tuple[str, ...] = ("Type", "resourceType", "ResourceType")
+_AWS_ID_KEYS: Tuple[str, ...] = ("LogicalId", "resourceId")
+_AWS_ARN_KEYS: Tuple[str, ...] = ("Arn", "arn")
+_AWS_VPC_KEYS: Tuple[str, ...] = ("VpcId", "vpcId")
+_AWS_TAG_KEYS: Tuple[str, ...] = ("Tags", "tags")
+_AWS_TAG_KEY_KEYS: Tuple[str, ...] = ("Key", "key", "Name")
+_AWS_TAG_VALUE_KEYS: Tuple[str, ...] = ("Value", "value")
+_AWS_NAME_KEYS: Tuple[str, ...] = ("Name", "FunctionName", "BucketName", "TableName", "ClusterName")
+_GCP_TYPE_KEYS: Tuple[str, ...] = ("assetType", "type")
+_GCP_NETWORK_KEYS: Tuple[str, ...] = ("network", "networkRef")
+_GCP_REGION_KEYS: Tuple[str, ...] = ("region", "location")
+
+# Azure resource IDs embed the resource group: /subscriptions/.../resourceGroups/<name>/...
+_RESOURCE_GROUP_RE = re.compile(r'/resourceGroups/([^/]+)', re.IGNORECASE)
+
+
+# IDs are drawn from a buffer refilled with one os.urandom() call per batch
+# rather than one uuid4() per node/edge.
+_ID_BATCH_SIZE = 1024
+_id_buffer: List[str] = []
+
+# A forked child must not hand out the same buffered IDs as its parent
+# (fork hooks only exist on POSIX; Windows has no fork to guard against)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_buffer.clear)
+
+
+def _generate_id_batch(count: int) -> List[str]:
+    """Generate count random 8-hex-character IDs."""
+    raw = os.urandom(4 * count).hex()
+    return [raw[i:i + 8] for i in range(0, 8 * count, 8)]
+
+
 def _generate_id() -> str:
     """Generate a unique node/edge ID."""
-    return str(uuid.uuid4())[:8]
+    try:
+        return _id_buffer.pop()
+    except IndexError:
+        _id_buffer.extend(_generate_id_batch(_ID_BATCH_SIZE))
+        return _id_buffer.pop()
 
 
+def _pick(data: Dict[str, Any], keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Return the first truthy value of data[key] for key in keys.
+    
+    Equivalent to `data.get(k1) or data.get(k2) or ... or default`, but as a
+    single loop over a precomputed key tuple.
+    """
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return default
+
+
+@lru_cache(maxsize=4096)
 def _normalize_resource_type(raw_type: str, provider: CloudProvider) -> Tuple[str, str]:
     """
     Normalize a cloud-specific resource type to standard service_type and category.
     
+    Inventories repeat a small set of resource types many times, so results
+    are memoized per (raw_type, provider).
+    
     Returns (service_type, category) tuple.
     """
     normalized = raw_type.lower().strip()
     
-    if provider == CloudProvider.AZURE:
-        mapping = AZURE_SERVICE_TYPES.get(normalized)
-        if mapping:
-            return mapping
-        # Try partial match for nested resources
-        for key, value in AZURE_SERVICE_TYPES.items():
-            if key in normalized or normalized in key:
-                return value
-                
-    elif provider == CloudProvider.AWS:
-        mapping = AWS_SERVICE_TYPES.get(normalized)
-        if mapping:
-            return mapping
-        # AWS CloudFormation format: AWS::Service::Resource
-        for key, value in AWS_SERVICE_TYPES.items():
-            if key in normalized or normalized in key:
-                return value
-                
-    elif provider == CloudProvider.GCP:
-        mapping = GCP_SERVICE_TYPES.get(normalized)
-        if mapping:
-            return mapping
-        for key, value in GCP_SERVICE_TYPES.items():
-            if key in normalized or normalized in key:
-                return value
+    mapping = _ALL_SERVICE_TYPES.get((provider, normalized))
+    if mapping:
+        return mapping
+    
+    # Try partial match for nested resources and format variants
+    # (e.g. AWS CloudFormation AWS::Service::Resource)
+    for key, value in _SERVICE_TYPES_BY_PROVIDER.get(provider, {}).items():
+        if key in normalized or normalized in key:
+            return value
     
     # Fallback: derive from resource type
     parts = re.split(r'[/:.]+', normalized)
-    service_type = parts[-1] if parts else "unknown"
+    service_type = sys.intern(parts[-1]) if parts else "unknown"
     category = "Other"
     
     return service_type, category
@@ -374,28 +417,27 @@ def _extract_region(resource: Dict[str, Any], provider: CloudProvider) -> Option
 
 def _extract_parent_id(resource: Dict[str, Any], provider: CloudProvider) -> Optional[str]:
     """Extract parent resource ID for hierarchy."""
-    if provider == CloudProvider.AZURE:
+    if provider is CloudProvider.AZURE:
         # Azure uses resource ID hierarchy
         resource_id = resource.get("id", "")
         if "/" in resource_id:
             # Extract resource group as parent
-            rg_match = re.search(r'/resourceGroups/([^/]+)', resource_id, re.IGNORECASE)
+            rg_match = _RESOURCE_GROUP_RE.search(resource_id)
             if rg_match:
                 return f"rg-{rg_match.group(1).lower()}"
                 
-    elif provider == CloudProvider.AWS:
+    elif provider is CloudProvider.AWS:
         # AWS uses VPC as parent for networking resources
         vpc_id = resource.get("vpcId") or resource.get("VpcId")
         if vpc_id:
             return vpc_id
             
-    elif provider == CloudProvider.GCP:
+    elif provider is CloudProvider.GCP:
         # GCP uses project/network hierarchy
         network = resource.get("network")
         if network:
             # Extract network name from full path
-            parts = network.split("/")
-            return parts[-1] if parts else None
+            return network.rpartition("/")[2]
     
     return None
 
@@ -409,87 +451,472 @@ def _infer_edges(nodes: List[InfraNode], provider: CloudProvider) -> List[InfraE
     - Network dependencies (same VNet/VPC)
     - Service dependencies from properties
     """
-    edges: List[InfraEdge] = []
-    node_by_id = {n.id: n for n in nodes}
+    # Keyed by (source, target, edge_type) so duplicates are dropped as they
+    # are proposed instead of in a separate pass over the finished list.
+    edges: Dict[Tuple[str, str, EdgeType], InfraEdge] = {}
+    # Column-wise view of the fields the heuristics read. The scans below
+    # index these lists instead of going through model attributes and
+    # properties.get() for every (node, other) pair.
+    ids: List[str] = []
+    parent_ids: List[Optional[str]] = []
+    subnet_ids: List[Any] = []
+    storage_refs: List[Any] = []
+    db_refs: List[Any] = []
+    # (node id, keys a storage reference may match) for storage nodes only
+    storage_targets: List[Tuple[str, Tuple[Any, ...]]] = []
+    # (node id, lowercase label) for database nodes only
+    db_targets: List[Tuple[str, str]] = []
+    
+    # Reverse indexes so same-subnet and storage matches are hash lookups
+    # rather than scans over every node. Property values are arbitrary JSON;
+    # unhashable ones (lists/objects) fall back to a scan over their own kind.
+    nodes_by_subnet: Dict[Any, List[int]] = {}
+    unhashable_subnet_nodes: List[int] = []
+    storage_by_key: Dict[Any, List[str]] = {}
+    
+    for i, node in enumerate(nodes):
+        props = node.properties
+        ids.append(node.id)
+        parent_ids.append(node.parent_id)
+        subnet = props.get("subnet_id") or props.get("subnetId")
+        subnet_ids.append(subnet)
+        if subnet:
+            try:
+                nodes_by_subnet.setdefault(subnet, []).append(i)
+            except TypeError:
+                unhashable_subnet_nodes.append(i)
+        storage_refs.append(props.get("storageAccountId") or props.get("storage_account"))
+        db_refs.append(
+            props.get("databaseId") or
+            props.get("database") or
+            props.get("connectionString")
+        )
+        if node.service_type in ("storage_account", "object_storage", "cloud_storage"):
+            keys = (node.id, node.resource_id, props.get("name"))
+            storage_targets.append((node.id, keys))
+            for key in keys:
+                try:
+                    matches = storage_by_key.setdefault(key, [])
+                except TypeError:
+                    continue
+                # A node listed under the same key twice (e.g. id == name) is kept once
+                if not matches or matches[-1] != node.id:
+                    matches.append(node.id)
+        if node.category == "Database":
+            db_targets.append((node.id, node.label.lower()))
+    
+    known_ids = set(ids)
+    count = len(ids)
+
+    def _add_edge(source: str, target: str, edge_type: EdgeType, label: str) -> None:
+        key = (source, target, edge_type)
+        if key in edges:
+            return
+        edges[key] = InfraEdge.model_construct(
+            id=f"edge-{_generate_id()}",
+            source=source,
+            target=target,
+            source_handle=None,
+            target_handle=None,
+            edge_type=edge_type.value,
+            label=label
+        )
     
-    for node in nodes:
+    for i in range(count):
+        node_id = ids[i]
+        
         # Containment edges from parent_id
-        if node.parent_id and node.parent_id in node_by_id:
-            edges.append(InfraEdge(
-                id=f"edge-{_generate_id()}",
-                source=node.parent_id,
-                target=node.id,
-                source_handle=None,
-                target_handle=None,
-                edge_type=EdgeType.CONTAINS,
-                label="contains"
-            ))
+        parent_id = parent_ids[i]
+        if parent_id and parent_id in known_ids:
+            _add_edge(parent_id, node_id, EdgeType.CONTAINS, "contains")
         
         # Network edges: resources in same subnet/VNet
-        node_subnet = node.properties.get("subnet_id") or node.properties.get("subnetId")
+        node_subnet = subnet_ids[i]
         if node_subnet:
-            for other in nodes:
-                if other.id != node.id:
-                    other_subnet = other.properties.get("subnet_id") or other.properties.get("subnetId")
-                    if node_subnet == other_subnet:
-                        # Avoid duplicates - only create edge in one direction
-                        if node.id < other.id:
-                            edges.append(InfraEdge(
-                                id=f"edge-{_generate_id()}",
-                                source=node.id,
-                                target=other.id,
-                                source_handle=None,
-                                target_handle=None,
-                                edge_type=EdgeType.NETWORK,
-                                label="same subnet"
-                            ))
+            try:
+                same_subnet = nodes_by_subnet[node_subnet]
+            except TypeError:
+                same_subnet = [
+                    j for j in unhashable_subnet_nodes if subnet_ids[j] == node_subnet
+                ]
+            for j in same_subnet:
+                other_id = ids[j]
+                # Avoid duplicates - only create edge in one direction
+                if node_id < other_id:
+                    _add_edge(node_id, other_id, EdgeType.NETWORK, "same subnet")
         
         # Data dependencies: storage account references
-        storage_ref = node.properties.get("storageAccountId") or node.properties.get("storage_account")
+        storage_ref = storage_refs[i]
         if storage_ref:
-            for other in nodes:
-                if other.service_type in ("storage_account", "object_storage", "cloud_storage"):
-                    if storage_ref in (other.id, other.resource_id, other.properties.get("name")):
-                        edges.append(InfraEdge(
-                            id=f"edge-{_generate_id()}",
-                            source=node.id,
-                            target=other.id,
-                            source_handle=None,
-                            target_handle=None,
-                            edge_type=EdgeType.DATA,
-                            label="uses storage"
-                        ))
+            try:
+                storage_matches = storage_by_key.get(storage_ref, ())
+            except TypeError:
+                storage_matches = [
+                    other_id for other_id, keys in storage_targets if storage_ref in keys
+                ]
+            for other_id in storage_matches:
+                _add_edge(node_id, other_id, EdgeType.DATA, "uses storage")
         
         # Database dependencies
-        db_ref = (
-            node.properties.get("databaseId") or 
-            node.properties.get("database") or
-            node.properties.get("connectionString")
-        )
-        if db_ref:
-            for other in nodes:
-                if other.category == "Database":
-                    if isinstance(db_ref, str) and (other.id in db_ref or other.label.lower() in db_ref.lower()):
-                        edges.append(InfraEdge(
-                            id=f"edge-{_generate_id()}",
-                            source=node.id,
-                            target=other.id,
-                            source_handle=None,
-                            target_handle=None,
-                            edge_type=EdgeType.DATA,
-                            label="database connection"
-                        ))
-    
-    # Deduplicate edges
-    seen = set()
-    unique_edges = []
-    for edge in edges:
-        key = (edge.source, edge.target, edge.edge_type)
-        if key not in seen:
-            seen.add(key)
-            unique_edges.append(edge)
-    
-    return unique_edges
+        db_ref = db_refs[i]
+        if db_ref and isinstance(db_ref, str):
+            db_ref_lower = db_ref.lower()
+            for other_id, other_label in db_targets:
+                if other_id in db_ref or other_label in db_ref_lower:
+                    _add_edge(node_id, other_id, EdgeType.DATA, "database connection")
+    
+    return list(edges.values())
+
+
+# -----------------------------------------------------------------------------
+# Per-Provider Node Builders
+# -----------------------------------------------------------------------------
+# The provider is fixed for a whole parse, so each parser gets its own builder
+# with the provider-specific tables referenced directly instead of dispatching
+# on CloudProvider for every resource.
+#
+# Nodes, edges and graphs built by the parsers use model_construct(): every
+# field is already normalized here, and per-instance validation dominated
+# parse time on large inventories. model_construct() skips use_enum_values, so
+# enum fields are passed as their .value like validation would store them.
+#
+# Node properties share the source resource's properties dict (which is also
+# reachable through raw_data) instead of copying it per resource; nothing
+# downstream mutates them. A copy is only made when the builder adds fields.
+
+# Fields that are identical for every synthesized grouping node of a kind.
+# Mutable fields (tags, properties) are always passed fresh per node.
+_AZURE_RESOURCE_GROUP_NODE_FIELDS: Dict[str, Any] = {
+    "provider": CloudProvider.AZURE.value,
+    "service_type": "resource_group",
+    "resource_id": None,
+    "resource_type": "Microsoft.Resources/resourceGroups",
+    "parent_id": None,
+    "icon_path": AZURE_ICON_PATHS.get("resource_group"),
+    "category": "Management",
+    "raw_data": None,
+}
+_AWS_VPC_NODE_FIELDS: Dict[str, Any] = {
+    "provider": CloudProvider.AWS.value,
+    "service_type": "vpc",
+    "resource_type": "AWS::EC2::VPC",
+    "parent_id": None,
+    "region": None,
+    "icon_path": AWS_ICON_PATHS.get("vpc"),
+    "category": "Networking",
+    "raw_data": None,
+}
+_GCP_NETWORK_NODE_FIELDS: Dict[str, Any] = {
+    "provider": CloudProvider.GCP.value,
+    "service_type": "vpc",
+    "resource_id": None,
+    "resource_type": "compute.googleapis.com/Network",
+    "parent_id": None,
+    "region": None,
+    "icon_path": None,
+    "category": "Networking",
+    "raw_data": None,
+}
+
+_NODE_OPTIONAL_STR_FIELDS: Tuple[str, ...] = ("resource_id", "resource_type", "parent_id", "region")
+
+
+def _new_node(**fields: Any) -> InfraNode:
+    """
+    Create an InfraNode, skipping validation when the inventory-derived fields
+    already have their declared types.
+    
+    Anything else (e.g. a CloudFormation intrinsic such as {"Fn::Sub": ...} used
+    as a name) goes through normal validation, which raises ValidationError.
+    """
+    tags = fields["tags"]
+    raw_data = fields["raw_data"]
+    if (
+        type(fields["id"]) is str
+        and type(fields["label"]) is str
+        and all(fields[key] is None or type(fields[key]) is str for key in _NODE_OPTIONAL_STR_FIELDS)
+        and type(tags) is dict
+        and all(type(key) is str and type(value) is str for key, value in tags.items())
+        and type(fields["properties"]) is dict
+        and (raw_data is None or type(raw_data) is dict)
+    ):
+        return InfraNode.model_construct(**fields)
+    return InfraNode(**fields)
+
+
+def _build_azure_node(
+    resource: Dict[str, Any],
+    resource_groups: Dict[str, InfraNode]
+) -> Optional[InfraNode]:
+    """
+    Build an InfraNode for a single Azure resource.
+    
+    Resource group nodes discovered along the way are added to resource_groups.
+    Returns None for entries without a resource type.
+    """
+    # Extract resource type
+    resource_type = resource.get("type", "")
+    if not resource_type:
+        return None
+    # Share one string object per distinct type across all nodes
+    resource_type = sys.intern(resource_type)
+    
+    # Normalize service type
+    service_type, category = _normalize_resource_type(resource_type, CloudProvider.AZURE)
+    
+    # Extract resource group for hierarchy
+    resource_id = resource.get("id", "")
+    rg_name = None
+    rg_match = _RESOURCE_GROUP_RE.search(resource_id)
+    if rg_match:
+        rg_name = rg_match.group(1)
+        # Create resource group node if not exists
+        rg_node_id = f"rg-{rg_name.lower()}"
+        if rg_node_id not in resource_groups:
+            rg_node = _new_node(
+                **_AZURE_RESOURCE_GROUP_NODE_FIELDS,
+                id=rg_node_id,
+                label=rg_name,
+                region=resource.get("location"),
+                tags={},
+                properties={"name": rg_name}
+            )
+            resource_groups[rg_node_id] = rg_node
+    
+    # Build node properties
+    properties: Dict[str, Any] = {}
+    if "properties" in resource and isinstance(resource["properties"], dict):
+        properties = resource["properties"]
+    if "sku" in resource or "kind" in resource:
+        # Copy before adding fields so the source resource is left untouched
+        properties = dict(properties)
+        if "sku" in resource:
+            properties["sku"] = resource["sku"]
+        if "kind" in resource:
+            properties["kind"] = resource["kind"]
+    
+    # Create node
+    return _new_node(
+        id=resource["name"] if "name" in resource else _generate_id(),
+        provider=CloudProvider.AZURE.value,
+        service_type=service_type,
+        label=resource.get("name", service_type),
+        resource_id=resource_id,
+        resource_type=resource_type,
+        parent_id=f"rg-{rg_name.lower()}" if rg_name else None,
+        region=resource.get("location"),
+        tags=resource.get("tags") or {},
+        properties=properties,
+        icon_path=AZURE_ICON_PATHS.get(service_type),
+        category=category,
+        raw_data=resource
+    )
+
+
+def _aws_properties(resource: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the (uncopied) properties dict of an AWS resource."""
+    if "Properties" in resource:
+        return resource["Properties"]
+    if "configuration" in resource:
+        return resource["configuration"]
+    return {}
+
+
+def _make_aws_vpc_node(vpc_id: str) -> InfraNode:
+    """Create the grouping node for an AWS VPC."""
+    return _new_node(
+        **_AWS_VPC_NODE_FIELDS,
+        id=vpc_id,
+        label=f"VPC {vpc_id}",
+        resource_id=vpc_id,
+        tags={},
+        properties={"vpcId": vpc_id}
+    )
+
+
+def _build_aws_vpc_nodes(resources: List[Dict[str, Any]]) -> Dict[str, InfraNode]:
+    """
+    Build one VPC node per distinct VPC referenced by the inventory.
+    
+    Done in a single pre-scan so the per-resource builder can reference the
+    VPC as parent without checking for (and creating) it on every resource.
+    """
+    vpc_ids = dict.fromkeys(
+        vpc_id
+        for resource in resources
+        if _pick(resource, _AWS_TYPE_KEYS)
+        and (vpc_id := _pick(_aws_properties(resource), _AWS_VPC_KEYS))
+    )
+    return {vpc_id: _make_aws_vpc_node(vpc_id) for vpc_id in vpc_ids}
+
+
+def _build_aws_node(resource: Dict[str, Any]) -> Optional[InfraNode]:
+    """
+    Build an InfraNode for a single AWS resource.
+    
+    VPC parents are created up front by _build_aws_vpc_nodes.
+    Returns None for entries without a resource type.
+    """
+    # Extract resource type (handle different formats)
+    resource_type = _pick(resource, _AWS_TYPE_KEYS, "")
+    if not resource_type:
+        return None
+    
+    # Normalize to AWS::Service::Resource format
+    if not resource_type.startswith("AWS::") and not resource_type.startswith("aws::"):
+        resource_type = f"AWS::{resource_type}"
+    # Share one string object per distinct type across all nodes
+    resource_type = sys.intern(resource_type)
+    
+    service_type, category = _normalize_resource_type(resource_type.lower(), CloudProvider.AWS)
+    
+    # Extract properties
+    properties = _aws_properties(resource)
+    
+    # VPC hierarchy (VPC nodes are built by _build_aws_vpc_nodes)
+    vpc_id = _pick(properties, _AWS_VPC_KEYS)
+    
+    # Generate node ID
+    node_id = (
+        _pick(resource, _AWS_ID_KEYS) or
+        resource.get("Arn", "").rpartition("/")[2] or
+        properties.get("Name") or
+        _generate_id()
+    )
+    
+    # Extract name
+    name = _pick(properties, _AWS_NAME_KEYS, node_id)
+    
+    # Extract region from ARN if present
+    region = None
+    arn = _pick(resource, _AWS_ARN_KEYS)
+    if arn:
+        # arn:partition:service:region:... - only the first four fields matter
+        arn_parts = arn.split(":", 4)
+        if len(arn_parts) >= 4:
+            region = arn_parts[3]
+    
+    # Convert tags from AWS list format to dictionary
+    raw_tags = properties.get("Tags") or _pick(resource, _AWS_TAG_KEYS, {})
+    tags = _convert_aws_tags(raw_tags)
+    
+    # Create node
+    return _new_node(
+        id=node_id,
+        provider=CloudProvider.AWS.value,
+        service_type=service_type,
+        label=name,
+        resource_id=arn or resource.get("resourceId"),
+        resource_type=resource_type,
+        parent_id=vpc_id,
+        region=region,
+        tags=tags,
+        properties=properties,
+        icon_path=AWS_ICON_PATHS.get(service_type),
+        category=category,
+        raw_data=resource
+    )
+
+
+def _gcp_properties(resource: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the (uncopied) properties dict of a GCP resource."""
+    resource_data = resource.get("resource", {}).get("data", {})
+    if resource_data:
+        return resource_data
+    if "properties" in resource:
+        return resource["properties"]
+    return {}
+
+
+def _make_gcp_network_node(network_name: str) -> InfraNode:
+    """Create the grouping node for a GCP VPC network."""
+    return _new_node(
+        **_GCP_NETWORK_NODE_FIELDS,
+        id=network_name,
+        label=f"VPC {network_name}",
+        tags={},
+        properties={"name": network_name}
+    )
+
+
+def _build_gcp_network_nodes(resources: List[Dict[str, Any]]) -> Dict[str, InfraNode]:
+    """
+    Build one VPC node per distinct network referenced by the inventory.
+    
+    Done in a single pre-scan so the per-resource builder can reference the
+    network as parent without checking for (and creating) it on every resource.
+    """
+    network_names = dict.fromkeys(
+        network_ref.rpartition("/")[2]
+        for resource in resources
+        if _pick(resource, _GCP_TYPE_KEYS)
+        and (network_ref := _pick(_gcp_properties(resource), _GCP_NETWORK_KEYS))
+    )
+    return {name: _make_gcp_network_node(name) for name in network_names}
+
+
+def _build_gcp_node(resource: Dict[str, Any]) -> Optional[InfraNode]:
+    """
+    Build an InfraNode for a single GCP resource.
+    
+    Network (VPC) parents are created up front by _build_gcp_network_nodes.
+    Returns None for entries without a resource type.
+    """
+    # Extract resource type
+    resource_type = _pick(resource, _GCP_TYPE_KEYS, "")
+    if not resource_type:
+        return None
+    # Share one string object per distinct type across all nodes
+    resource_type = sys.intern(resource_type)
+    
+    service_type, category = _normalize_resource_type(resource_type, CloudProvider.GCP)
+    
+    # Extract properties from nested resource structure
+    properties = _gcp_properties(resource)
+    
+    # Network hierarchy (network nodes are built by _build_gcp_network_nodes)
+    network_ref = _pick(properties, _GCP_NETWORK_KEYS)
+    
+    # Generate node ID
+    name = (
+        resource.get("name") or
+        properties.get("name") or
+        resource.get("displayName") or
+        _generate_id()
+    )
+    
+    # Extract region/zone
+    region = None
+    zone = properties.get("zone") or resource.get("zone")
+    if zone:
+        # Extract region from zone (e.g., us-central1-a -> us-central1)
+        region = zone.rpartition("-")[0] if "-" in zone else zone
+    else:
+        region = _pick(properties, _GCP_REGION_KEYS)
+    
+    # Extract self link as resource ID
+    resource_id = (
+        resource.get("name") or
+        properties.get("selfLink") or
+        resource.get("resource", {}).get("location")
+    )
+    
+    # Create node
+    return _new_node(
+        id=name,
+        provider=CloudProvider.GCP.value,
+        service_type=service_type,
+        label=name,
+        resource_id=resource_id,
+        resource_type=resource_type,
+        parent_id=network_ref.rpartition("/")[2] if network_ref else None,
+        region=region,
+        tags=properties.get("labels") or {},
+        properties=properties,
+        icon_path=None,
+        category=category,
+        raw_data=resource
+    )
 
 
 # -----------------------------------------------------------------------------
@@ -529,87 +956,31 @@ def normalize_azure(raw_inventory: Dict[str, Any]) -> InfraGraph:
         resources = [raw_inventory]
     
     logger.info(f"Parsing {len(resources)} Azure resources")
+    original_count = len(resources)
+    # Drop non-object entries once so the builders need no per-item check
+    resources = [r for r in resources if isinstance(r, dict)]
     
     for resource in resources:
-        if not isinstance(resource, dict):
-            continue
-            
-        # Extract resource type
-        resource_type = resource.get("type", "")
-        if not resource_type:
-            continue
-        
-        # Normalize service type
-        service_type, category = _normalize_resource_type(resource_type, CloudProvider.AZURE)
-        
-        # Extract resource group for hierarchy
-        resource_id = resource.get("id", "")
-        rg_name = None
-        rg_match = re.search(r'/resourceGroups/([^/]+)', resource_id, re.IGNORECASE)
-        if rg_match:
-            rg_name = rg_match.group(1)
-            # Create resource group node if not exists
-            rg_node_id = f"rg-{rg_name.lower()}"
-            if rg_node_id not in resource_groups:
-                rg_node = InfraNode(
-                    id=rg_node_id,
-                    provider=CloudProvider.AZURE,
-                    service_type="resource_group",
-                    label=rg_name,
-                    resource_id=None,
-                    resource_type="Microsoft.Resources/resourceGroups",
-                    parent_id=None,
-                    region=resource.get("location"),
-                    tags={},
-                    properties={"name": rg_name},
-                    icon_path=_get_icon_path("resource_group", CloudProvider.AZURE),
-                    category="Management",
-                    raw_data=None
-                )
-                resource_groups[rg_node_id] = rg_node
-        
-        # Build node properties
-        properties: Dict[str, Any] = {}
-        if "properties" in resource and isinstance(resource["properties"], dict):
-            properties = resource["properties"].copy()
-        if "sku" in resource:
-            properties["sku"] = resource["sku"]
-        if "kind" in resource:
-            properties["kind"] = resource["kind"]
-        
-        # Create node
-        node = InfraNode(
-            id=resource.get("name", _generate_id()),
-            provider=CloudProvider.AZURE,
-            service_type=service_type,
-            label=resource.get("name", service_type),
-            resource_id=resource_id,
-            resource_type=resource_type,
-            parent_id=f"rg-{rg_name.lower()}" if rg_name else None,
-            region=resource.get("location"),
-            tags=resource.get("tags", {}),
-            properties=properties,
-            icon_path=_get_icon_path(service_type, CloudProvider.AZURE),
-            category=category,
-            raw_data=resource
-        )
-        nodes.append(node)
+        node = _build_azure_node(resource, resource_groups)
+        if node is not None:
+            nodes.append(node)
     
     # Add resource group nodes
-    nodes = list(resource_groups.values()) + nodes
+    nodes[:0] = resource_groups.values()
     
     # Infer edges
     edges = _infer_edges(nodes, CloudProvider.AZURE)
     
     logger.info(f"Created {len(nodes)} nodes and {len(edges)} edges from Azure inventory")
-    return InfraGraph(
-        provider=CloudProvider.AZURE,
+    now = datetime.now(timezone.utc)
+    return InfraGraph.model_construct(
+        provider=CloudProvider.AZURE.value,
         nodes=nodes,
         edges=edges,
         source="azure_import",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-        metadata={"original_count": len(resources)}
+        created_at=now,
+        updated_at=now,
+        metadata={"original_count": original_count}
     )
 
 
@@ -633,9 +1004,6 @@ def normalize_aws(raw_inventory: Dict[str, Any]) -> InfraGraph:
     Returns:
         InfraGraph with normalized nodes and inferred edges
     """
-    nodes: List[InfraNode] = []
-    vpcs: Dict[str, InfraNode] = {}
-    
     # Detect format and extract resources
     resources = []
     if "Resources" in raw_inventory:
@@ -655,116 +1023,27 @@ def normalize_aws(raw_inventory: Dict[str, Any]) -> InfraGraph:
         resources = [raw_inventory]
     
     logger.info(f"Parsing {len(resources)} AWS resources")
+    original_count = len(resources)
+    # Drop non-object entries once so the builders need no per-item check
+    resources = [r for r in resources if isinstance(r, dict)]
     
-    for resource in resources:
-        if not isinstance(resource, dict):
-            continue
-        
-        # Extract resource type (handle different formats)
-        resource_type = (
-            resource.get("Type") or 
-            resource.get("resourceType") or 
-            resource.get("ResourceType") or
-            ""
-        )
-        if not resource_type:
-            continue
-        
-        # Normalize to AWS::Service::Resource format
-        if not resource_type.startswith("AWS::") and not resource_type.startswith("aws::"):
-            resource_type = f"AWS::{resource_type}"
-        
-        service_type, category = _normalize_resource_type(resource_type.lower(), CloudProvider.AWS)
-        
-        # Extract properties
-        properties: Dict[str, Any] = {}
-        if "Properties" in resource:
-            properties = resource["Properties"].copy()
-        elif "configuration" in resource:
-            properties = resource["configuration"].copy()
-        
-        # Handle VPC hierarchy
-        vpc_id = properties.get("VpcId") or properties.get("vpcId")
-        if vpc_id and vpc_id not in vpcs:
-            vpc_node = InfraNode(
-                id=vpc_id,
-                provider=CloudProvider.AWS,
-                service_type="vpc",
-                label=f"VPC {vpc_id}",
-                resource_id=vpc_id,
-                resource_type="AWS::EC2::VPC",
-                parent_id=None,
-                region=None,
-                tags={},
-                properties={"vpcId": vpc_id},
-                icon_path=_get_icon_path("vpc", CloudProvider.AWS),
-                category="Networking",
-                raw_data=None
-            )
-            vpcs[vpc_id] = vpc_node
-        
-        # Generate node ID
-        node_id = (
-            resource.get("LogicalId") or
-            resource.get("resourceId") or
-            resource.get("Arn", "").split("/")[-1] or
-            properties.get("Name") or
-            _generate_id()
-        )
-        
-        # Extract name
-        name = (
-            properties.get("Name") or
-            properties.get("FunctionName") or
-            properties.get("BucketName") or
-            properties.get("TableName") or
-            properties.get("ClusterName") or
-            node_id
-        )
-        
-        # Extract region from ARN if present
-        region = None
-        arn = resource.get("Arn") or resource.get("arn")
-        if arn:
-            arn_parts = arn.split(":")
-            if len(arn_parts) >= 4:
-                region = arn_parts[3]
-        
-        # Convert tags from AWS list format to dictionary
-        raw_tags = properties.get("Tags") or resource.get("Tags") or resource.get("tags") or {}
-        tags = _convert_aws_tags(raw_tags)
-        
-        # Create node
-        node = InfraNode(
-            id=node_id,
-            provider=CloudProvider.AWS,
-            service_type=service_type,
-            label=name,
-            resource_id=arn or resource.get("resourceId"),
-            resource_type=resource_type,
-            parent_id=vpc_id,
-            region=region,
-            tags=tags,
-            properties=properties,
-            icon_path=_get_icon_path(service_type, CloudProvider.AWS),
-            category=category,
-            raw_data=resource
-        )
-        nodes.append(node)
+    vpcs = _build_aws_vpc_nodes(resources)
+    nodes = [node for node in map(_build_aws_node, resources) if node is not None]
     
     # Add VPC nodes
-    nodes = list(vpcs.values()) + nodes
+    nodes[:0] = vpcs.values()
     
     # Infer edges
     edges = _infer_edges(nodes, CloudProvider.AWS)
-    return InfraGraph(
-        provider=CloudProvider.AWS,
+    now = datetime.now(timezone.utc)
+    return InfraGraph.model_construct(
+        provider=CloudProvider.AWS.value,
         nodes=nodes,
         edges=edges,
         source="aws_import",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-        metadata={"original_count": len(resources)}
+        created_at=now,
+        updated_at=now,
+        metadata={"original_count": original_count}
     )
 
 
@@ -787,9 +1066,6 @@ def normalize_gcp(raw_inventory: Dict[str, Any]) -> InfraGraph:
     Returns:
         InfraGraph with normalized nodes and inferred edges
     """
-    nodes: List[InfraNode] = []
-    networks: Dict[str, InfraNode] = {}
-    
     # Detect format and extract resources
     resources = []
     if "assets" in raw_inventory:
@@ -803,109 +1079,200 @@ def normalize_gcp(raw_inventory: Dict[str, Any]) -> InfraGraph:
         resources = [raw_inventory]
     
     logger.info(f"Parsing {len(resources)} GCP resources")
+    original_count = len(resources)
+    # Drop non-object entries once so the builders need no per-item check
+    resources = [r for r in resources if isinstance(r, dict)]
     
-    for resource in resources:
-        if not isinstance(resource, dict):
-            continue
-        
-        # Extract resource type
-        resource_type = (
-            resource.get("assetType") or
-            resource.get("type") or
-            ""
+    networks = _build_gcp_network_nodes(resources)
+    nodes = [node for node in map(_build_gcp_node, resources) if node is not None]
+    
+    # Add network nodes
+    nodes[:0] = networks.values()
+    
+    # Infer edges
+    edges = _infer_edges(nodes, CloudProvider.GCP)
+    
+    logger.info(f"Created {len(nodes)} nodes and {len(edges)} edges from GCP inventory")
+    now = datetime.now(timezone.utc)
+    return InfraGraph.model_construct(
+        provider=CloudProvider.GCP.value,
+        nodes=nodes,
+        edges=edges,
+        source="gcp_import",
+        created_at=now,
+        updated_at=now,
+        metadata={"original_count": original_count}
+    )
+
+
+# -----------------------------------------------------------------------------
+# Streaming Parsers
+# -----------------------------------------------------------------------------
+# For inventories too large to json.load() comfortably. Resources are decoded
+# one at a time with ijson (optional dependency), so peak memory is bounded by
+# the resulting graph rather than the size of the export file.
+
+# ijson prefixes of the arrays / objects that hold resources in each format
+_AWS_STREAM_ARRAYS: Tuple[str, ...] = ("resources.item", "ResourceIdentifiers.item", "item")
+_AWS_STREAM_MAPS: Tuple[str, ...] = ("Resources",)
+_GCP_STREAM_ARRAYS: Tuple[str, ...] = ("assets.item", "resources.item", "item")
+
+
+def _import_ijson() -> Any:
+    """Import ijson, which is only needed for the streaming parsers."""
+    try:
+        import ijson
+    except ImportError:
+        raise ImportError(
+            "ijson is required for streaming inventory parsing. Install with: pip install ijson"
         )
-        if not resource_type:
+    return ijson
+
+
+def _stream_resources(
+    fp: IO[bytes],
+    array_prefixes: Tuple[str, ...],
+    map_prefixes: Tuple[str, ...] = ()
+) -> Iterator[Tuple[Optional[str], Any]]:
+    """
+    Yield (key, resource) pairs from a JSON inventory file.
+    
+    Items of arrays at array_prefixes are yielded with key None; values of
+    objects at map_prefixes (e.g. CloudFormation "Resources") are yielded
+    with their key.
+    """
+    ijson = _import_ijson()
+    
+    builder = None
+    depth = 0
+    map_key: Optional[str] = None
+    map_value_prefix: Optional[str] = None
+    item_key: Optional[str] = None
+    
+    for prefix, event, value in ijson.parse(fp, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth == 0:
+                yield item_key, builder.value
+                builder = None
             continue
         
-        service_type, category = _normalize_resource_type(resource_type, CloudProvider.GCP)
-        
-        # Extract properties from nested resource structure
-        properties: Dict[str, Any] = {}
-        resource_data = resource.get("resource", {}).get("data", {})
-        if resource_data:
-            properties = resource_data.copy()
-        elif "properties" in resource:
-            properties = resource["properties"].copy()
-        
-        # Handle network hierarchy
-        network_ref = properties.get("network") or properties.get("networkRef")
-        if network_ref:
-            network_name = network_ref.split("/")[-1] if "/" in network_ref else network_ref
-            if network_name not in networks:
-                network_node = InfraNode(
-                    id=network_name,
-                    provider=CloudProvider.GCP,
-                    service_type="vpc",
-                    label=f"VPC {network_name}",
-                    resource_id=None,
-                    resource_type="compute.googleapis.com/Network",
-                    parent_id=None,
-                    region=None,
-                    tags={},
-                    properties={"name": network_name},
-                    icon_path=None,
-                    category="Networking",
-                    raw_data=None
-                )
-                networks[network_name] = network_node
+        if event == "map_key":
+            if prefix in map_prefixes:
+                map_key = value
+                map_value_prefix = f"{prefix}.{value}"
+            continue
         
-        # Generate node ID
-        name = (
-            resource.get("name") or
-            properties.get("name") or
-            resource.get("displayName") or
-            _generate_id()
-        )
+        if prefix in array_prefixes:
+            item_key = None
+        elif prefix == map_value_prefix:
+            item_key = map_key
+        else:
+            continue
         
-        # Extract region/zone
-        region = None
-        zone = properties.get("zone") or resource.get("zone")
-        if zone:
-            # Extract region from zone (e.g., us-central1-a -> us-central1)
-            region = "-".join(zone.split("-")[:-1]) if "-" in zone else zone
+        if event in ("start_map", "start_array"):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            depth = 1
         else:
-            region = properties.get("region") or properties.get("location")
+            # Scalar entry; callers skip these
+            yield item_key, value
+
+
+def normalize_aws_stream(fp: IO[bytes]) -> InfraGraph:
+    """
+    Parse an AWS inventory JSON file into InfraGraph without loading it whole.
+    
+    Accepts the CloudFormation, resource list and Resource Explorer formats
+    of normalize_aws().
+    
+    Args:
+        fp: Binary file object positioned at the start of the JSON document
         
-        # Extract self link as resource ID
-        resource_id = (
-            resource.get("name") or
-            properties.get("selfLink") or
-            resource.get("resource", {}).get("location")
-        )
+    Returns:
+        InfraGraph with normalized nodes and inferred edges
+    """
+    nodes: List[InfraNode] = []
+    vpc_ids: Dict[str, None] = {}
+    count = 0
+    
+    for logical_id, resource in _stream_resources(fp, _AWS_STREAM_ARRAYS, _AWS_STREAM_MAPS):
+        count += 1
+        if not isinstance(resource, dict):
+            continue
+        if logical_id is not None:
+            resource["LogicalId"] = logical_id
+        node = _build_aws_node(resource)
+        if node is not None:
+            nodes.append(node)
+            if node.parent_id:
+                vpc_ids[node.parent_id] = None
+    
+    # Add VPC nodes
+    nodes[:0] = map(_make_aws_vpc_node, vpc_ids)
+    
+    # Infer edges
+    edges = _infer_edges(nodes, CloudProvider.AWS)
+    
+    logger.info(f"Created {len(nodes)} nodes and {len(edges)} edges from streamed AWS inventory")
+    now = datetime.now(timezone.utc)
+    return InfraGraph.model_construct(
+        provider=CloudProvider.AWS.value,
+        nodes=nodes,
+        edges=edges,
+        source="aws_import",
+        created_at=now,
+        updated_at=now,
+        metadata={"original_count": count}
+    )
+
+
+def normalize_gcp_stream(fp: IO[bytes]) -> InfraGraph:
+    """
+    Parse a GCP inventory JSON file into InfraGraph without loading it whole.
+    
+    Accepts the asset and resource list formats of normalize_gcp().
+    
+    Args:
+        fp: Binary file object positioned at the start of the JSON document
         
-        # Create node
-        node = InfraNode(
-            id=name,
-            provider=CloudProvider.GCP,
-            service_type=service_type,
-            label=name,
-            resource_id=resource_id,
-            resource_type=resource_type,
-            parent_id=network_ref.split("/")[-1] if network_ref else None,
-            region=region,
-            tags=properties.get("labels", {}),
-            properties=properties,
-            icon_path=None,
-            category=category,
-            raw_data=resource
-        )
-        nodes.append(node)
+    Returns:
+        InfraGraph with normalized nodes and inferred edges
+    """
+    nodes: List[InfraNode] = []
+    network_names: Dict[str, None] = {}
+    count = 0
+    
+    for _, resource in _stream_resources(fp, _GCP_STREAM_ARRAYS):
+        count += 1
+        if not isinstance(resource, dict):
+            continue
+        node = _build_gcp_node(resource)
+        if node is not None:
+            nodes.append(node)
+            if node.parent_id:
+                network_names[node.parent_id] = None
     
     # Add network nodes
-    nodes = list(networks.values()) + nodes
+    nodes[:0] = map(_make_gcp_network_node, network_names)
     
     # Infer edges
     edges = _infer_edges(nodes, CloudProvider.GCP)
     
-    logger.info(f"Created {len(nodes)} nodes and {len(edges)} edges from GCP inventory")
-    return InfraGraph(
-        provider=CloudProvider.GCP,
+    logger.info(f"Created {len(nodes)} nodes and {len(edges)} edges from streamed GCP inventory")
+    now = datetime.now(timezone.utc)
+    return InfraGraph.model_construct(
+        provider=CloudProvider.GCP.value,
         nodes=nodes,
         edges=edges,
         source="gcp_import",
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-        metadata={"original_count": len(resources)}
+        created_at=now,
+        updated_at=now,
+        metadata={"original_count": count}
     )
 
 
@@ -913,6 +1280,14 @@ def normalize_gcp(raw_inventory: Dict[str, Any]) -> InfraGraph:
 # Auto-Detection and Unified Parser
 # -----------------------------------------------------------------------------
 
+# Top-level keys that only occur in one provider's export format, in the order
+# they are checked (after the Azure/GCP first-item and CloudFormation checks)
+_PROVIDER_MARKERS: Tuple[Tuple[str, CloudProvider], ...] = (
+    ("ResourceIdentifiers", CloudProvider.AWS),  # AWS Resource Explorer
+    ("assets", CloudProvider.GCP),  # GCP Cloud Asset Inventory
+)
+
+
 def detect_provider(raw_inventory: Any) -> Optional[CloudProvider]:
     """
     Auto-detect cloud provider from inventory structure.
@@ -920,46 +1295,44 @@ def detect_provider(raw_inventory: Any) -> Optional[CloudProvider]:
     Returns:
         CloudProvider or None if cannot determine
     """
-    # Check for Azure patterns
-    if "value" in raw_inventory:
-        # Azure Resource Graph format
-        first = raw_inventory["value"][0] if raw_inventory["value"] else {}
-        if isinstance(first, dict) and "type" in first:
-            resource_type = first["type"].lower()
-            if resource_type.startswith("microsoft."):
-                return CloudProvider.AZURE
-    
-    if "resources" in raw_inventory:
-        resources = raw_inventory["resources"]
-        if resources and isinstance(resources[0], dict):
-            first = resources[0]
-            # Check for Azure resource type
-            if "type" in first:
-                rt = first["type"].lower()
-                if rt.startswith("microsoft."):
+    if isinstance(raw_inventory, dict):
+        # Check for Azure patterns
+        if "value" in raw_inventory:
+            # Azure Resource Graph format
+            first = raw_inventory["value"][0] if raw_inventory["value"] else {}
+            if isinstance(first, dict) and "type" in first:
+                resource_type = first["type"].lower()
+                if resource_type.startswith("microsoft."):
                     return CloudProvider.AZURE
-            # Check for GCP asset type
-            if "assetType" in first:
-                return CloudProvider.GCP
-    
-    # Check for AWS patterns
-    if "Resources" in raw_inventory:
-        # CloudFormation format
-        for resource in raw_inventory["Resources"].values():
-            if "Type" in resource:
-                rt = resource["Type"]
-                if rt.startswith("AWS::"):
-                    return CloudProvider.AWS
-    
-    if "ResourceIdentifiers" in raw_inventory:
-        return CloudProvider.AWS
-    
-    # Check for GCP patterns
-    if "assets" in raw_inventory:
-        return CloudProvider.GCP
+        
+        if "resources" in raw_inventory:
+            resources = raw_inventory["resources"]
+            if resources and isinstance(resources[0], dict):
+                first = resources[0]
+                # Check for Azure resource type
+                if "type" in first:
+                    rt = first["type"].lower()
+                    if rt.startswith("microsoft."):
+                        return CloudProvider.AZURE
+                # Check for GCP asset type
+                if "assetType" in first:
+                    return CloudProvider.GCP
+        
+        # Check for AWS CloudFormation format
+        if "Resources" in raw_inventory:
+            for resource in raw_inventory["Resources"].values():
+                if "Type" in resource:
+                    rt = resource["Type"]
+                    if rt.startswith("AWS::"):
+                        return CloudProvider.AWS
+        
+        # Top-level keys that identify the provider on their own
+        for key, provider in _PROVIDER_MARKERS:
+            if key in raw_inventory:
+                return provider
     
     # Check list format
-    if isinstance(raw_inventory, list) and raw_inventory:
+    elif isinstance(raw_inventory, list) and raw_inventory:
         first = raw_inventory[0]
         if isinstance(first, dict):
             if "type" in first:
@@ -974,15 +1347,117 @@ def detect_provider(raw_inventory: Any) -> Optional[CloudProvider]:
     return None
 
 
+# ijson prefixes of the top-level object's arrays whose first element
+# detect_provider() inspects
+_DETECT_FIRST_ITEM_PREFIXES: Tuple[str, ...] = ("value.item", "resources.item")
+
+
+def detect_provider_stream(fp: IO[bytes]) -> Optional[CloudProvider]:
+    """
+    Auto-detect cloud provider from an inventory JSON file.
+    
+    Reads the file incrementally into a skeleton holding only what
+    detect_provider() looks at (the top-level keys, the type/assetType of the
+    first element of each inspected array and one AWS:: CloudFormation
+    resource type), then applies detect_provider() to it, so both always
+    agree. Memory use does not depend on the size of the export. A top-level
+    array is decided after its first element and an Azure first item under
+    "value" as soon as it is read; anything else needs the whole file, as a
+    later key may take precedence. The file position is left wherever
+    detection stopped.
+    
+    Returns:
+        CloudProvider or None if cannot determine
+    """
+    ijson = _import_ijson()
+    events = ijson.parse(fp)
+    _, root, _ = next(events, ("", None, None))
+    skeleton: Any
+    if root == "start_array":
+        skeleton = []
+        item_prefixes: Tuple[str, ...] = ("item",)
+    elif root == "start_map":
+        skeleton = {}
+        item_prefixes = _DETECT_FIRST_ITEM_PREFIXES
+    else:
+        return None
+    # Arrays whose first element has been read completely
+    inspected: Set[str] = set()
+    
+    for prefix, event, value in events:
+        if prefix == "":
+            if event == "map_key":
+                # The marker checks only need the key to be present
+                skeleton[value] = None
+            continue
+        
+        if prefix in item_prefixes:
+            array = skeleton if root == "start_array" else skeleton.get(prefix.rpartition(".")[0])
+            if not isinstance(array, list) or prefix in inspected:
+                continue
+            if not array:
+                # First element: objects are filled in below, anything else is kept as is
+                array.append({} if event == "start_map" else value)
+                if event == "start_map":
+                    continue
+            elif event == "map_key":
+                if value == "assetType":
+                    array[0][value] = None
+                continue
+            elif event != "end_map":
+                continue
+            inspected.add(prefix)
+            if root == "start_array":
+                return detect_provider(skeleton)
+            if prefix == "value.item" and detect_provider({"value": array}) is CloudProvider.AZURE:
+                # The value check comes first, so nothing later can override it
+                return CloudProvider.AZURE
+            continue
+        
+        if event == "start_array" and prefix in skeleton and "." not in prefix:
+            skeleton[prefix] = []
+        elif event == "start_map" and prefix == "Resources":
+            skeleton[prefix] = {}
+        elif event == "string":
+            container, _, field = prefix.rpartition(".")
+            if field == "type" and container in item_prefixes:
+                array = skeleton if root == "start_array" else skeleton.get(container.rpartition(".")[0])
+                if isinstance(array, list) and container not in inspected and array and isinstance(array[0], dict):
+                    array[0][field] = value
+            elif (
+                field == "Type" and value.startswith("AWS::")
+                and container.partition(".")[0] == "Resources" and container.count(".") == 1
+                and isinstance(skeleton, dict) and skeleton.get("Resources") == {}
+            ):
+                # CloudFormation format: one AWS resource is all detect_provider() needs
+                skeleton["Resources"][container] = {"Type": value}
+    
+    return detect_provider(skeleton)
+
+
+_NORMALIZERS: Dict[CloudProvider, Callable[[Dict[str, Any]], InfraGraph]] = {
+    CloudProvider.AZURE: normalize_azure,
+    CloudProvider.AWS: normalize_aws,
+    CloudProvider.GCP: normalize_gcp,
+}
+
+_STREAM_NORMALIZERS: Dict[CloudProvider, Callable[[IO[bytes]], InfraGraph]] = {
+    CloudProvider.AWS: normalize_aws_stream,
+    CloudProvider.GCP: normalize_gcp_stream,
+}
+
+
 def parse_inventory(
-    raw_inventory: Dict[str, Any],
+    raw_inventory: Union[Dict[str, Any], IO[bytes]],
     provider: Optional[CloudProvider] = None
 ) -> InfraGraph:
     """
     Parse cloud inventory with auto-detection.
     
     Args:
-        raw_inventory: Raw cloud inventory JSON
+        raw_inventory: Raw cloud inventory JSON, or a seekable binary file
+            containing it. Files are detected and (for AWS/GCP) parsed
+            incrementally via the streaming parsers.
         provider: Optional provider hint (auto-detects if None)
         
     Returns:
@@ -991,6 +1466,9 @@ def parse_inventory(
     Raises:
         ValueError: If provider cannot be determined
     """
+    if hasattr(raw_inventory, "read"):
+        return _parse_inventory_file(raw_inventory, provider)
+    
     if provider is None:
         provider = detect_provider(raw_inventory)
     
@@ -1000,11 +1478,27 @@ def parse_inventory(
             "Please specify provider explicitly."
         )
     
-    if provider == CloudProvider.AZURE:
-        return normalize_azure(raw_inventory)
-    elif provider == CloudProvider.AWS:
-        return normalize_aws(raw_inventory)
-    elif provider == CloudProvider.GCP:
-        return normalize_gcp(raw_inventory)
-    else:
+    normalize = _NORMALIZERS.get(provider)
+    if normalize is None:
         raise ValueError(f"Unsupported provider: {provider}")
+    return normalize(raw_inventory)
+
+
+def _parse_inventory_file(fp: IO[bytes], provider: Optional[CloudProvider]) -> InfraGraph:
+    """parse_inventory() for file objects."""
+    if provider is None:
+        provider = detect_provider_stream(fp)
+        fp.seek(0)
+    
+    if provider is None:
+        raise ValueError(
+            "Cannot determine cloud provider from inventory format. "
+            "Please specify provider explicitly."
+        )
+    
+    stream_normalize = _STREAM_NORMALIZERS.get(provider)
+    if stream_normalize is not None:
+        return stream_normalize(fp)
+    
+    # No streaming parser for this provider; load the document
+    return parse_inventory(json.load(fp), provider)
@@ -1,17 +1,23 @@
 """Azure client manager for centralized Azure service access."""
 
-import logging
-from typing import Optional, Union
+from __future__ import annotations
 
-from azure.identity.aio import DefaultAzureCredential
-from azure.storage.blob.aio import BlobServiceClient
-from azure.ai.projects.aio import AIProjectClient
-from agent_framework.azure import AzureAIAgentClient
-from openai import AsyncOpenAI
-from agent_framework.openai import OpenAIAssistantsClient, OpenAIChatClient
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Optional, Union
 
 from app.core.config import settings
 
+# The Azure and OpenAI SDKs are only imported in the initialize() branch that
+# uses them, so local-model and OpenAI deployments never pay their import cost.
+if TYPE_CHECKING:
+    from azure.identity.aio import DefaultAzureCredential
+    from azure.storage.blob.aio import BlobServiceClient
+    from azure.ai.projects.aio import AIProjectClient
+    from agent_framework.azure import AzureAIAgentClient
+    from openai import AsyncOpenAI
+    from agent_framework.openai import OpenAIAssistantsClient, OpenAIChatClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +50,9 @@ class AzureClientManager:
             logger.info(f"Local model client initialized: {local_client.backend} with model {local_client.model}")
         # Prefer explicit OpenAI fallback when configured via flag or API key.
         elif settings.USE_OPENAI_FALLBACK or bool(settings.OPENAI_API_KEY):
+            from openai import AsyncOpenAI
+            from agent_framework.openai import OpenAIAssistantsClient, OpenAIChatClient
+            
             # Initialize OpenAI clients
             self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
             # Some wrappers require a model id at construction time; pass the
@@ -64,6 +73,11 @@ class AzureClientManager:
             )
             logger.info("OpenAI clients initialized successfully (fallback)")
         else:
+            from azure.identity.aio import DefaultAzureCredential
+            from azure.storage.blob.aio import BlobServiceClient
+            from azure.ai.projects.aio import AIProjectClient
+            from agent_framework.azure import AzureAIAgentClient
+            
             # Initialize Azure credential
             self.credential = DefaultAzureCredential()
             
@@ -127,13 +141,16 @@ class AzureClientManager:
             settings.AZURE_STORAGE_CONTAINER_NAME_CONVERSATIONS,
         ]
         
-        for container_name in containers:
+        async def _create(container_name: str) -> None:
             try:
                 await self.blob_client.create_container(container_name)
                 logger.info(f"Created container: {container_name}")
             except Exception as e:
                 if "ContainerAlreadyExists" not in str(e):
                     logger.warning(f"Failed to create container {container_name}: {e}")
+        
+        # Independent round-trips; issue them concurrently
+        await asyncio.gather(*(_create(name) for name in containers))
                     
     def get_blob_client(self) -> BlobServiceClient:
         """Get the blob storage client."""
@@ -1,18 +1,34 @@
 """Configuration settings for the Azure Architect Backend."""
 
-from typing import Any, List
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import json
+import os
+from functools import cached_property, lru_cache
+from typing import Annotated, Any, Tuple
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+_DEFAULT_CORS_ORIGINS = ("http://localhost:5173", "http://localhost:3000")
+
+# ENVIRONMENT values for which the .env file is not read
+_PRODUCTION_ENVIRONMENTS = frozenset({"production", "prod"})
+
+# Hosts that serve MCP documentation pages rather than a streamable MCP endpoint
+_BICEP_DOCS_HOSTS = ("learn.microsoft.com", "docs.microsoft.com")
+_TERRAFORM_DOCS_HOSTS = ("developer.hashicorp.com", "github.com/hashicorp")
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
+    # Production deployments receive their configuration as real environment
+    # variables, so the .env file is skipped there and read everywhere else.
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=None if os.getenv("ENVIRONMENT", "").strip().lower() in _PRODUCTION_ENVIRONMENTS else ".env",
         env_file_encoding="utf-8",
         case_sensitive=True,
-        extra="ignore"
+        extra="ignore",
+        frozen=True,
     )
     
     # OpenAI (fallback for easier testing)
@@ -49,9 +65,10 @@ class Settings(BaseSettings):
     # Application settings
     ENVIRONMENT: str = Field(default="development", description="Environment name")
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
-    CORS_ORIGINS: List[str] = Field(
-        default=["http://localhost:5173", "http://localhost:3000"],
-        description="CORS allowed origins"
+    # NoDecode: the validator below parses the raw env value (JSON or comma-separated)
+    CORS_ORIGINS: Annotated[Tuple[str, ...], NoDecode] = Field(
+        default=_DEFAULT_CORS_ORIGINS,
+        description="CORS allowed origins (JSON list or comma-separated)"
     )
     FRONTEND_BASE_URL: str = Field(default="http://localhost:8080/app", description="Frontend base URL (including path) for share links")
     
@@ -82,7 +99,31 @@ class Settings(BaseSettings):
     DEPLOYMENT_TIMEOUT_MINUTES: int = Field(default=30, description="Deployment timeout")
     MAX_CONCURRENT_DEPLOYMENTS: int = Field(default=3, description="Max concurrent deployments")
     
-    @property
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
+    def parse_cors_origins(cls, v: Any) -> Tuple[str, ...]:
+        """Accept a JSON list or a comma-separated string; store an immutable tuple.
+
+        An empty value (string or sequence) falls back to the localhost defaults.
+        """
+        if isinstance(v, str):
+            v = json.loads(v) if v.lstrip().startswith("[") else v.split(",")
+        origins = tuple(s for s in map(str.strip, v or ()) if s)
+        return origins or _DEFAULT_CORS_ORIGINS
+
+    @cached_property
+    def azure_mcp_bicep_is_docs_only(self) -> bool:
+        """Whether AZURE_MCP_BICEP_URL points at documentation instead of an MCP server."""
+        url = (self.AZURE_MCP_BICEP_URL or "").lower()
+        return any(host in url for host in _BICEP_DOCS_HOSTS)
+
+    @cached_property
+    def terraform_mcp_is_docs_only(self) -> bool:
+        """Whether TERRAFORM_MCP_URL points at documentation instead of an MCP server."""
+        url = (self.TERRAFORM_MCP_URL or "").lower()
+        return any(host in url for host in _TERRAFORM_DOCS_HOSTS)
+
+    @cached_property
     def storage_connection_string(self) -> str | None:
         """Generate storage connection string."""
         if not self.AZURE_STORAGE_ACCOUNT_NAME:
@@ -90,5 +131,11 @@ class Settings(BaseSettings):
         return f"DefaultEndpointsProtocol=https;AccountName={self.AZURE_STORAGE_ACCOUNT_NAME};BlobEndpoint=https://{self.AZURE_STORAGE_ACCOUNT_NAME}.blob.core.windows.net/;AccountKey=<key_from_managed_identity>"
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, loading ``.env`` on first use only."""
+    return Settings()
+
+
+# Global settings instance (kept for existing ``from app.core.config import settings`` users)
+settings = get_settings()
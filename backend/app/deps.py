@@ -3,291 +3,325 @@
 import os
 import logging
 import time
+import random
 import asyncio
-from typing import Optional
+import threading
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
 
 try:
     import httpx
 except ImportError:  # pragma: no cover
     httpx = None
 
-logger = logging.getLogger(__name__)
-
-# Global MCP tool instances for connection pooling
-_mcp_bicep_tool: Optional[object] = None
-_mcp_terraform_tool: Optional[object] = None
-_microsoft_docs_mcp_tool: Optional[object] = None
-_mcp_terraform_backoff_until: Optional[float] = None
-_mcp_bicep_backoff_until: Optional[float] = None
-_microsoft_docs_backoff_until: Optional[float] = None
+try:
+    from agent_framework import MCPStreamableHTTPTool
+    _MCP_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    MCPStreamableHTTPTool = None
+    _MCP_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
 
-async def get_mcp_bicep_tool():
-    """Get or create the Azure Bicep MCP tool singleton.
-    
-    Opens a persistent connection to the Azure Bicep MCP server for
-    schema lookups and validation during IaC generation.
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
+
+_STREAMABLE_NOTE = (
+    "Note: Browsers and plain HTTP POSTs won't work; use MCPStreamableHTTPTool from agent_framework "
+    "which establishes a streaming MCP session."
+)
+
+
+@dataclass
+class MCPSpec:
+    """Static description of an MCP server the backend can connect to."""
+    key: str
+    name: str
+    url_attr: str
+    force_env: Optional[str] = None
+    docs_only_attr: Optional[str] = None
+    docs_label: str = ""
+
+
+BICEP_SPEC = MCPSpec(
+    key="bicep",
+    name="Azure Bicep MCP",
+    url_attr="AZURE_MCP_BICEP_URL",
+    force_env="AZURE_MCP_BICEP_FORCE",
+    docs_only_attr="azure_mcp_bicep_is_docs_only",
+    docs_label="learn.microsoft.com",
+)
+TERRAFORM_SPEC = MCPSpec(
+    key="terraform",
+    name="HashiCorp Terraform MCP",
+    url_attr="TERRAFORM_MCP_URL",
+    force_env="TERRAFORM_MCP_FORCE",
+    docs_only_attr="terraform_mcp_is_docs_only",
+    docs_label="HashiCorp",
+)
+DOCS_SPEC = MCPSpec(
+    key="docs",
+    name="Microsoft Learn MCP",
+    url_attr="MICROSOFT_LEARN_MCP_URL",
+)
+
+# Failed initialisations retry after an exponentially growing, fully jittered
+# delay so that workers recovering together don't stampede the MCP endpoint.
+_BACKOFF_BASE_SECONDS = 5
+_BACKOFF_CAP_SECONDS = 600
+
+
+@dataclass(slots=True)
+class ToolState:
+    """Mutable connection state for one MCP tool.
+
+    The lock serialises first-time initialisation so concurrent requests share one
+    handshake, and the exit stack owns the open session until cleanup closes it.
     """
-    global _mcp_bicep_tool, _mcp_bicep_backoff_until
+    tool: Optional[Any] = None
+    exit_stack: Optional[AsyncExitStack] = None
+    backoff_until: Optional[float] = None
+    attempts: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
-    if _mcp_bicep_backoff_until and time.time() < _mcp_bicep_backoff_until:
-        if _mcp_bicep_tool is None:
-            logger.debug(
-                "Skipping Azure Bicep MCP initialization until %.0f due to previous errors",
-                _mcp_bicep_backoff_until,
-            )
-        return _mcp_bicep_tool
-    if _mcp_bicep_tool is None:
-        try:
-            from app.core.config import settings
-            mcp_url = (settings.AZURE_MCP_BICEP_URL or "").strip()
 
-            # Basic guard: don't attempt to initialize when no real MCP endpoint is configured
-            force_init = os.getenv("AZURE_MCP_BICEP_FORCE", "false").lower() in ("1", "true", "yes")
-            if (not mcp_url or "learn.microsoft.com" in mcp_url or "docs.microsoft.com" in mcp_url) and not force_init:
-                logger.info(
-                    "Azure Bicep MCP URL not configured or points to docs; skipping MCP initialization.\n"
-                    "If you intend to use the official learn.microsoft.com MCP endpoint, ensure your environment supports a streamable MCP HTTP transport and set AZURE_MCP_BICEP_FORCE=true to force initialization.\n"
-                    "Note: Browsers and plain HTTP POSTs won't work; use MCPStreamableHTTPTool from agent_framework which establishes a streaming MCP session."
-                )
-                return None
+# Global MCP tool instances for connection pooling, keyed by MCPSpec.key
+_tools: Dict[str, ToolState] = {spec.key: ToolState() for spec in (BICEP_SPEC, TERRAFORM_SPEC, DOCS_SPEC)}
 
-            # Import MCP tool from agent framework
-            from agent_framework import MCPStreamableHTTPTool
 
-            _mcp_bicep_tool = MCPStreamableHTTPTool(
-                name="Azure Bicep MCP",
-                url=mcp_url,
-            )
+def _is_rate_limited(exc: BaseException) -> bool:
+    return httpx is not None and isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 429
 
-            # Open connection once and reuse
-            enter_method = getattr(_mcp_bicep_tool, '__aenter__', None)
-            if enter_method:
-                try:
-                    await enter_method()
-                except (Exception, asyncio.CancelledError) as exc:  # pragma: no cover - network dependent
-                    logger.warning("Failed to initialize Azure Bicep MCP tool (%s). Falling back to local generation.", exc)
-                    _mcp_bicep_tool = None
-                    _mcp_bicep_backoff_until = time.time() + 300
-                    return None
-            logger.info(f"Initialized Azure Bicep MCP tool at {mcp_url}")
-            _mcp_bicep_backoff_until = None
-
-        except ImportError:
-            logger.warning("MCPStreamableHTTPTool not installed - MCP integration disabled.\n" \
-                           "Install the agent_framework package that provides MCPStreamableHTTPTool to enable MCP features.")
-            _mcp_bicep_tool = None
-            _mcp_bicep_backoff_until = None
-        except Exception as e:
-            logger.error(f"Failed to initialize MCP Bicep tool: {e}")
-            _mcp_bicep_tool = None
-            _mcp_bicep_backoff_until = time.time() + 300
-    
-    return _mcp_bicep_tool
 
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Return the server's Retry-After delay in seconds, if the error carries one."""
+    if httpx is None or not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _next_backoff(state: ToolState, exc: BaseException) -> float:
+    """Advance the tool's retry attempt counter and return the delay before the next try."""
+    attempt = state.attempts
+    state.attempts = attempt + 1
+    retry_after = _retry_after_seconds(exc)
+    if retry_after is not None:
+        return retry_after
+    return random.uniform(0, min(_BACKOFF_CAP_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** attempt))
+
+
+def _is_task_cancelling() -> bool:
+    """Whether the running task has a pending cancellation request."""
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+async def _get_mcp_tool(spec: MCPSpec):
+    """Get or create the MCP tool singleton described by ``spec``."""
+    state = _tools[spec.key]
+    if state.tool is not None:
+        return state.tool
+
+    # Backoff deadlines are on the monotonic clock so wall-clock jumps can't skew them
+    now = time.monotonic()
+    backoff_until = state.backoff_until
+    if backoff_until and now < backoff_until:
+        logger.debug(
+            "Skipping %s initialization for another %.0f seconds due to previous errors",
+            spec.name,
+            backoff_until - now,
+        )
+        return None
+
+    async with state.lock:
+        # Another coroutine may have finished (or failed) while we waited
+        backoff_until = state.backoff_until
+        if state.tool is not None or (backoff_until and time.monotonic() < backoff_until):
+            return state.tool
+        exit_stack: Optional[AsyncExitStack] = None
+        try:
+            settings = get_settings()
+            url_attr, force_env, docs_only_attr = spec.url_attr, spec.force_env, spec.docs_only_attr
+            mcp_url = (getattr(settings, url_attr) or "").strip()
 
-async def get_mcp_terraform_tool():
-    """Get or create the HashiCorp Terraform MCP tool singleton.
-    
-    Opens a persistent connection to the HashiCorp Terraform MCP server for
-    provider/resource schema lookups and validation during Terraform generation.
-    """
-    global _mcp_terraform_tool, _mcp_terraform_backoff_until
+            # Basic guard: don't attempt to initialize when no real MCP endpoint is configured
+            force_init = bool(force_env) and os.getenv(force_env, "").lower() in _TRUTHY
+            points_to_docs = bool(docs_only_attr) and getattr(settings, docs_only_attr)
+            if (not mcp_url or points_to_docs) and not force_init:
+                if force_env:
+                    logger.info(
+                        "%s URL not configured or points to docs; skipping MCP initialization.\n"
+                        "If you intend to use the official %s MCP endpoint, ensure your environment supports a "
+                        "streamable MCP HTTP transport and set %s=true to force initialization.\n%s",
+                        spec.name, spec.docs_label, force_env, _STREAMABLE_NOTE,
+                    )
+                else:
+                    logger.info("%s URL not configured; skipping MCP initialization.", spec.name)
+                return None
 
-    if _mcp_terraform_backoff_until and time.time() < _mcp_terraform_backoff_until:
-        if _mcp_terraform_tool is None:
-            logger.debug(
-                "Skipping Terraform MCP initialization until %.0f due to previous rate limiting",
-                _mcp_terraform_backoff_until,
-            )
-        return _mcp_terraform_tool
-    if _mcp_terraform_tool is None:
-        try:
-            from app.core.config import settings
-            mcp_url = (settings.TERRAFORM_MCP_URL or "").strip()
-
-            force_init = os.getenv("TERRAFORM_MCP_FORCE", "false").lower() in ("1", "true", "yes")
-            if (not mcp_url or "developer.hashicorp.com" in mcp_url or "github.com/hashicorp" in mcp_url) and not force_init:
-                logger.info(
-                    "Terraform MCP URL not configured or points to docs; skipping MCP initialization.\n"
-                    "If you intend to use the official HashiCorp MCP endpoint, ensure your environment supports a streamable MCP HTTP transport and set TERRAFORM_MCP_FORCE=true to force initialization.\n"
-                    "Note: Browsers and plain HTTP POSTs won't work; use MCPStreamableHTTPTool from agent_framework which establishes a streaming MCP session."
+            if not _MCP_AVAILABLE:
+                logger.warning(
+                    "MCPStreamableHTTPTool not installed - %s integration disabled.\n"
+                    "Install the agent_framework package that provides MCPStreamableHTTPTool to enable MCP features.",
+                    spec.name,
                 )
+                state.backoff_until = None
                 return None
 
-            # Import MCP tool from agent framework
-            from agent_framework import MCPStreamableHTTPTool
-
-            _mcp_terraform_tool = MCPStreamableHTTPTool(
-                name="HashiCorp Terraform MCP",
-                url=mcp_url,
-            )
+            tool = MCPStreamableHTTPTool(name=spec.name, url=mcp_url)
 
             # Open connection once and reuse
-            enter_method = getattr(_mcp_terraform_tool, '__aenter__', None)
-            if enter_method:
-                await enter_method()
-            logger.info(f"Initialized HashiCorp Terraform MCP tool at {mcp_url}")
-            _mcp_terraform_backoff_until = None
-
-        except ImportError:
-            logger.warning("MCPStreamableHTTPTool not installed - Terraform MCP integration disabled.\n" \
-                           "Install the agent_framework package that provides MCPStreamableHTTPTool to enable MCP features.")
-            _mcp_terraform_tool = None
-            _mcp_terraform_backoff_until = None
-        except (Exception, asyncio.CancelledError) as e:
-            _mcp_terraform_tool = None
-            backoff_seconds = 300
-            is_rate_limited = False
-            if httpx is not None and isinstance(e, httpx.HTTPStatusError):
-                status = getattr(e.response, "status_code", None)
-                if status == 429:
-                    is_rate_limited = True
-            if "429" in str(e):
-                is_rate_limited = True
-
-            if is_rate_limited:
+            exit_stack = AsyncExitStack()
+            await exit_stack.enter_async_context(tool)
+
+            # Publish only once the session is open so callers never see a half-entered tool
+            state.tool = tool
+            state.exit_stack = exit_stack
+            state.backoff_until = None
+            state.attempts = 0
+            logger.info("Initialized %s tool at %s", spec.name, mcp_url)
+
+        except (Exception, asyncio.CancelledError) as e:  # pragma: no cover - network dependent
+            # The MCP/anyio transport also raises CancelledError when a connection
+            # fails; only a cancellation of this task (e.g. the startup warm-up at
+            # shutdown) propagates, without a backoff and without leaking a partly
+            # entered session.
+            if isinstance(e, asyncio.CancelledError) and _is_task_cancelling():
+                if exit_stack is not None:
+                    await _close_mcp_tool(spec, exit_stack)
+                raise
+            state.tool = None
+            backoff_seconds = _next_backoff(state, e)
+            if _is_rate_limited(e):
                 logger.warning(
-                    "Terraform MCP server returned HTTP 429 (rate limit). Falling back to local generation and sleeping for %s seconds.",
+                    "%s server returned HTTP 429 (rate limit). Falling back to local generation and sleeping for %.0f seconds.",
+                    spec.name,
                     backoff_seconds,
                 )
-                _mcp_terraform_backoff_until = time.time() + backoff_seconds
             else:
-                logger.error(f"Failed to initialize MCP Terraform tool: {e}")
-                # Avoid hammering the endpoint repeatedly; back off briefly.
-                _mcp_terraform_backoff_until = time.time() + 60
+                logger.warning(
+                    "Failed to initialize %s tool (%s). Falling back to local generation and retrying in %.0f seconds.",
+                    spec.name,
+                    e,
+                    backoff_seconds,
+                )
+            state.backoff_until = time.monotonic() + backoff_seconds
 
-            _mcp_terraform_tool = None
-    
-    return _mcp_terraform_tool
+    return state.tool
 
 
-async def cleanup_mcp_tools():
-    """Clean up MCP tool connections on app shutdown."""
-    global _mcp_bicep_tool, _mcp_terraform_tool, _microsoft_docs_mcp_tool
-    
-    # Clean up Bicep MCP tool
-    if _mcp_bicep_tool is not None:
-        try:
-            cleanup_method = getattr(_mcp_bicep_tool, '__aexit__', None)
-            if cleanup_method:
-                await cleanup_method(None, None, None)
-            logger.info("Cleaned up MCP Bicep tool connection")
-        except Exception as e:
-            logger.warning(f"Error cleaning up MCP Bicep tool: {e}")
-        finally:
-            _mcp_bicep_tool = None
+async def get_mcp_bicep_tool():
+    """Get or create the Azure Bicep MCP tool singleton.
     
-    # Clean up Terraform MCP tool
-    if _mcp_terraform_tool is not None:
-        try:
-            cleanup_method = getattr(_mcp_terraform_tool, '__aexit__', None)
-            if cleanup_method:
-                await cleanup_method(None, None, None)
-            logger.info("Cleaned up MCP Terraform tool connection")
-        except Exception as e:
-            logger.warning(f"Error cleaning up MCP Terraform tool: {e}")
-        finally:
-            _mcp_terraform_tool = None
+    Opens a persistent connection to the Azure Bicep MCP server for
+    schema lookups and validation during IaC generation.
+    """
+    return await _get_mcp_tool(BICEP_SPEC)
 
-    # Clean up Microsoft Docs MCP tool
-    if _microsoft_docs_mcp_tool is not None:
-        try:
-            cleanup_method = getattr(_microsoft_docs_mcp_tool, '__aexit__', None)
-            if cleanup_method:
-                await cleanup_method(None, None, None)
-            logger.info("Cleaned up Microsoft Docs MCP tool connection")
-        except Exception as e:
-            logger.warning(f"Error cleaning up Microsoft Docs MCP tool: {e}")
-        finally:
-            _microsoft_docs_mcp_tool = None
+
+async def get_mcp_terraform_tool():
+    """Get or create the HashiCorp Terraform MCP tool singleton.
+    
+    Opens a persistent connection to the HashiCorp Terraform MCP server for
+    provider/resource schema lookups and validation during Terraform generation.
+    """
+    return await _get_mcp_tool(TERRAFORM_SPEC)
 
 
 async def get_microsoft_docs_mcp_tool():
     """Get or create the Microsoft Learn documentation MCP tool singleton."""
-    global _microsoft_docs_mcp_tool, _microsoft_docs_backoff_until
+    return await _get_mcp_tool(DOCS_SPEC)
 
-    if _microsoft_docs_backoff_until and time.time() < _microsoft_docs_backoff_until:
-        if _microsoft_docs_mcp_tool is None:
-            logger.debug(
-                "Skipping Microsoft Docs MCP initialization until %.0f due to previous errors",
-                _microsoft_docs_backoff_until,
-            )
-        return _microsoft_docs_mcp_tool
 
-    if _microsoft_docs_mcp_tool is None:
-        try:
-            from app.core.config import settings
-            mcp_url = (settings.MICROSOFT_LEARN_MCP_URL or "").strip()
+async def warm_up_mcp_tools() -> None:
+    """Open all configured MCP sessions ahead of the first request.
 
-            if not mcp_url:
-                logger.info("Microsoft Learn MCP URL not configured; skipping docs MCP initialization.")
-                return None
+    Failures are already logged and backed off by the getters, so they are
+    swallowed here; unconfigured tools simply stay unset.
+    """
+    await asyncio.gather(
+        get_mcp_bicep_tool(),
+        get_mcp_terraform_tool(),
+        get_microsoft_docs_mcp_tool(),
+        return_exceptions=True,
+    )
 
-            from agent_framework import MCPStreamableHTTPTool
 
-            _microsoft_docs_mcp_tool = MCPStreamableHTTPTool(
-                name="Microsoft Learn MCP",
-                url=mcp_url,
-            )
+async def _close_mcp_tool(spec: MCPSpec, exit_stack: AsyncExitStack) -> None:
+    try:
+        await exit_stack.aclose()
+        logger.info("Cleaned up %s tool connection", spec.name)
+    except Exception as e:
+        logger.warning("Error cleaning up %s tool: %s", spec.name, e)
 
-            enter_method = getattr(_microsoft_docs_mcp_tool, '__aenter__', None)
-            if enter_method:
-                try:
-                    await enter_method()
-                except (Exception, asyncio.CancelledError) as exc:
-                    logger.warning(
-                        "Failed to initialize Microsoft Docs MCP tool (%s). Continuing without documentation MCP.",
-                        exc,
-                    )
-                    _microsoft_docs_mcp_tool = None
-                    _microsoft_docs_backoff_until = time.time() + 300
-                    return None
 
-            logger.info(f"Initialized Microsoft Docs MCP tool at {mcp_url}")
-            _microsoft_docs_backoff_until = None
+async def cleanup_mcp_tools():
+    """Clean up MCP tool connections on app shutdown.
 
-        except ImportError:
-            logger.warning("MCPStreamableHTTPTool not installed - Microsoft Docs MCP integration disabled.")
-            _microsoft_docs_mcp_tool = None
-            _microsoft_docs_backoff_until = None
-        except Exception as e:
-            logger.warning(f"Failed to initialize Microsoft Docs MCP tool: {e}")
-            _microsoft_docs_mcp_tool = None
-            _microsoft_docs_backoff_until = time.time() + 300
+    The sessions talk to unrelated hosts, so they are closed concurrently.
+    """
+    closers = []
+    for spec in (BICEP_SPEC, TERRAFORM_SPEC, DOCS_SPEC):
+        state = _tools[spec.key]
+        exit_stack = state.exit_stack
+        state.tool = None
+        state.exit_stack = None
+        if exit_stack is not None:
+            closers.append(_close_mcp_tool(spec, exit_stack))
+    await asyncio.gather(*closers, return_exceptions=True)
 
-    return _microsoft_docs_mcp_tool
 
+# Agent client shared by the dual-pass validation and other AI agents
+_agent_client: Optional[Any] = None
+_agent_credential: Optional[Any] = None
+_agent_client_lock = threading.Lock()
 
-def get_agent_client():
-    """Get the appropriate agent client for dual-pass validation and other AI agents.
-    
-    Priority:
-    1. Local models (Ollama/AI Foundry) if USE_OLLAMA or USE_FOUNDRY_LOCAL is set
-    2. OpenAI if USE_OPENAI_FALLBACK or OPENAI_API_KEY is set
-    3. Azure AI if Azure credentials are configured
-    
-    Returns a client that supports create_agent() method.
+
+def _create_agent_client():
+    """Resolve the configured agent client backend.
+
+    Returns ``(client, credential)``; ``credential`` is the async Azure
+    credential to close on shutdown, or None for the other backends.
     """
-    from app.core.config import settings
+    settings = get_settings()
+    use_openai_fallback, openai_api_key, openai_model, project_endpoint, deployment_name = (
+        settings.USE_OPENAI_FALLBACK,
+        settings.OPENAI_API_KEY,
+        settings.OPENAI_MODEL,
+        settings.AZURE_AI_PROJECT_ENDPOINT,
+        settings.AZURE_AI_MODEL_DEPLOYMENT_NAME,
+    )
     
     # Check for local model configuration first
     from app.agents.clients.local_model_client import get_local_model_client
     local_client = get_local_model_client()
     if local_client:
         logger.info(f"Using local model client for validation: {local_client.backend}")
-        return local_client
+        return local_client, None
     
     # Check for OpenAI fallback
-    if settings.USE_OPENAI_FALLBACK or bool(settings.OPENAI_API_KEY):
+    if use_openai_fallback or bool(openai_api_key):
         try:
             from agent_framework.openai import OpenAIChatClient
             client = OpenAIChatClient(
-                model_id=settings.OPENAI_MODEL,
-                api_key=settings.OPENAI_API_KEY,
+                model_id=openai_model,
+                api_key=openai_api_key,
             )
-            logger.info(f"Using OpenAI client for validation: {settings.OPENAI_MODEL}")
-            return client
+            logger.info(f"Using OpenAI client for validation: {openai_model}")
+            return client, None
         except Exception as e:
             logger.error(f"Failed to create OpenAI client: {e}")
     
@@ -298,15 +332,52 @@ def get_agent_client():
         
         credential = DefaultAzureCredential()
         client = AzureAIAgentClient(
-            project_endpoint=settings.AZURE_AI_PROJECT_ENDPOINT,
-            model_deployment_name=settings.AZURE_AI_MODEL_DEPLOYMENT_NAME,
+            project_endpoint=project_endpoint,
+            model_deployment_name=deployment_name,
             credential=credential
         )
-        logger.info(f"Using Azure AI client for validation: {settings.AZURE_AI_MODEL_DEPLOYMENT_NAME}")
-        return client
+        logger.info(f"Using Azure AI client for validation: {deployment_name}")
+        return client, credential
     except Exception as e:
         logger.error(f"Failed to create Azure AI client: {e}")
         raise RuntimeError(
             "No valid agent client available. Configure one of: "
             "OPENAI_API_KEY, USE_OLLAMA, or Azure AI credentials"
         )
+
+
+def get_agent_client():
+    """Get the appropriate agent client for dual-pass validation and other AI agents.
+    
+    Priority:
+    1. Local models (Ollama/AI Foundry) if USE_OLLAMA or USE_FOUNDRY_LOCAL is set
+    2. OpenAI if USE_OPENAI_FALLBACK or OPENAI_API_KEY is set
+    3. Azure AI if Azure credentials are configured
+    
+    Returns a client that supports create_agent() method. The backend is
+    resolved once per process and reused until cleanup_agent_client().
+    """
+    global _agent_client, _agent_credential
+
+    client = _agent_client
+    if client is not None:
+        return client
+    with _agent_client_lock:
+        if _agent_client is None:
+            _agent_client, _agent_credential = _create_agent_client()
+        return _agent_client
+
+
+async def cleanup_agent_client():
+    """Drop the cached agent client and close its Azure credential on app shutdown."""
+    global _agent_client, _agent_credential
+
+    with _agent_client_lock:
+        credential = _agent_credential
+        _agent_client = None
+        _agent_credential = None
+    if credential is not None:
+        try:
+            await credential.close()
+        except Exception as e:
+            logger.warning(f"Error closing agent client credential: {e}")
@@ -9,16 +9,20 @@ in the UI or downstream reports.
 
 from __future__ import annotations
 
-from copy import deepcopy
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import accumulate
 import logging
+from operator import itemgetter
 import re
-from typing import Any, Dict, List, Optional, Sequence
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AwsMigrationResult:
     """Structured result of a migration pass."""
 
@@ -31,14 +35,24 @@ class AwsMigrationResult:
     applied: bool = False
 
 
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+# Byte table mapping everything but [a-z0-9] to a space, for the ASCII translate fast path
+_NORMALIZE_TABLE = bytes(c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else 0x20 for c in range(256))
+
+
+@lru_cache(maxsize=2048)
 def _normalize(value: str | None) -> str:
     if not value:
         return ""
-    return re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
+    lowered = value.lower()
+    if not lowered.isascii():
+        return _NORMALIZE_RE.sub(" ", lowered).strip()
+    return " ".join(lowered.encode("ascii").translate(_NORMALIZE_TABLE).decode("ascii").split())
 
 
-def _bicep_vm_snippet() -> str:
-    return """@description('Virtual machine that replaces the EC2 instance')
+# Canned Bicep snippets surfaced alongside each migrated service, keyed by template name.
+_BICEP_TEMPLATES: Dict[str, str] = {
+    "vm": """@description('Virtual machine that replaces the EC2 instance')
 param location string = resourceGroup().location
 param vmName string = 'vm-${uniqueString(resourceGroup().id)}'
 
@@ -73,11 +87,8 @@ resource vm 'Microsoft.Compute/virtualMachines@2023-09-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_functions_snippet() -> str:
-    return """@description('Azure Function replacing AWS Lambda')
+""",
+    "functions": """@description('Azure Function replacing AWS Lambda')
 param location string = resourceGroup().location
 param storageAccountName string
 param functionAppName string = 'fn-${uniqueString(resourceGroup().id)}'
@@ -109,11 +120,8 @@ resource functionApp 'Microsoft.Web/sites@2022-09-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_storage_snippet() -> str:
-    return """@description('Storage account replacing Amazon S3')
+""",
+    "storage": """@description('Storage account replacing Amazon S3')
 param location string = resourceGroup().location
 param storageAccountName string = 'st${uniqueString(resourceGroup().id)}'
 
@@ -129,11 +137,8 @@ resource storageAccount 'Microsoft.Storage/storageAccounts@2023-01-01' = {
     allowBlobPublicAccess: false
   }
 }
-"""
-
-
-def _bicep_cosmos_snippet() -> str:
-    return """@description('Azure Cosmos DB replacing Amazon DynamoDB')
+""",
+    "cosmos": """@description('Azure Cosmos DB replacing Amazon DynamoDB')
 param location string = resourceGroup().location
 param accountName string = 'cosmos${uniqueString(resourceGroup().id)}'
 
@@ -159,11 +164,8 @@ resource cosmosAccount 'Microsoft.DocumentDB/databaseAccounts@2023-04-15' = {
     ]
   }
 }
-"""
-
-
-def _bicep_sql_snippet() -> str:
-    return """@description('Azure SQL Database replacing Amazon RDS')
+""",
+    "sql": """@description('Azure SQL Database replacing Amazon RDS')
 param location string = resourceGroup().location
 param sqlServerName string = 'sql${uniqueString(resourceGroup().id)}'
 param sqlDbName string = 'sqldb${uniqueString(resourceGroup().id)}'
@@ -187,11 +189,8 @@ resource sqlDb 'Microsoft.Sql/servers/databases@2022-05-01-preview' = {
     }
   }
 }
-"""
-
-
-def _bicep_api_management_snippet() -> str:
-    return """@description('Azure API Management replacing Amazon API Gateway')
+""",
+    "api_management": """@description('Azure API Management replacing Amazon API Gateway')
 param location string = resourceGroup().location
 param apiManagementName string = 'apim-${uniqueString(resourceGroup().id)}'
 
@@ -207,11 +206,8 @@ resource apim 'Microsoft.ApiManagement/service@2023-03-01-preview' = {
     publisherName: 'Cloud Visualizer'
   }
 }
-"""
-
-
-def _bicep_vnet_snippet() -> str:
-    return """@description('Azure Virtual Network replacing Amazon VPC')
+""",
+    "vnet": """@description('Azure Virtual Network replacing Amazon VPC')
 param location string = resourceGroup().location
 param vnetName string = 'vnet-${uniqueString(resourceGroup().id)}'
 
@@ -234,11 +230,35 @@ resource virtualNetwork 'Microsoft.Network/virtualNetworks@2023-04-01' = {
     ]
   }
 }
-"""
-
+""",
+    "aks": """@description('Azure Kubernetes Service replacing Amazon ECS/EKS')
+param location string = resourceGroup().location
+param clusterName string = 'aks-${uniqueString(resourceGroup().id)}'
 
-def _bicep_service_bus_snippet() -> str:
-    return """@description('Azure Service Bus replacing Amazon SQS/SNS')
+resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
+  name: clusterName
+  location: location
+  sku: {
+    name: 'Base'
+    tier: 'Standard'
+  }
+  properties: {
+    dnsPrefix: clusterName
+    kubernetesVersion: '1.29.0'
+    agentPoolProfiles: [
+      {
+        name: 'systempool'
+        count: 2
+        vmSize: 'Standard_B4ms'
+        osType: 'Linux'
+        type: 'VirtualMachineScaleSets'
+        mode: 'System'
+      }
+    ]
+  }
+}
+""",
+    "service_bus": """@description('Azure Service Bus replacing Amazon SQS/SNS')
 param location string = resourceGroup().location
 param namespaceName string = 'sb${uniqueString(resourceGroup().id)}'
 
@@ -251,11 +271,8 @@ resource serviceBus 'Microsoft.ServiceBus/namespaces@2022-10-01-preview' = {
     capacity: 1
   }
 }
-"""
-
-
-def _bicep_front_door_snippet() -> str:
-    return """@description('Azure Front Door replacing Amazon CloudFront')
+""",
+    "front_door": """@description('Azure Front Door replacing Amazon CloudFront')
 param fwName string = 'afd-${uniqueString(resourceGroup().id)}'
 
 resource frontDoor 'Microsoft.Cdn/profiles@2023-05-01' = {
@@ -265,11 +282,8 @@ resource frontDoor 'Microsoft.Cdn/profiles@2023-05-01' = {
     name: 'Premium_AzureFrontDoor'
   }
 }
-"""
-
-
-def _bicep_static_web_app_snippet() -> str:
-    return """@description('Azure Static Web App replacing AWS Amplify')
+""",
+    "static_web_app": """@description('Azure Static Web App replacing AWS Amplify')
 param location string = resourceGroup().location
 param appName string = 'swa-${uniqueString(resourceGroup().id)}'
 
@@ -286,11 +300,8 @@ resource staticApp 'Microsoft.Web/staticSites@2022-09-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_logic_app_snippet() -> str:
-    return """@description('Azure Logic App replacing AWS Step Functions')
+""",
+    "logic_app": """@description('Azure Logic App replacing AWS Step Functions')
 param location string = resourceGroup().location
 param logicAppName string = 'logic-${uniqueString(resourceGroup().id)}'
 
@@ -309,11 +320,8 @@ resource logicApp 'Microsoft.Logic/workflows@2019-05-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_form_recognizer_snippet() -> str:
-    return """@description('Azure AI Form Recognizer replacing Amazon Textract')
+""",
+    "form_recognizer": """@description('Azure AI Form Recognizer replacing Amazon Textract')
 param location string = resourceGroup().location
 param accountName string = 'form${uniqueString(resourceGroup().id)}'
 
@@ -326,11 +334,8 @@ resource formRecognizer 'Microsoft.CognitiveServices/accounts@2023-05-01' = {
   }
   properties: {}
 }
-"""
-
-
-def _bicep_vision_snippet() -> str:
-    return """@description('Azure AI Vision replacing Amazon Rekognition')
+""",
+    "vision": """@description('Azure AI Vision replacing Amazon Rekognition')
 param location string = resourceGroup().location
 param accountName string = 'vision${uniqueString(resourceGroup().id)}'
 
@@ -343,11 +348,8 @@ resource vision 'Microsoft.CognitiveServices/accounts@2023-05-01' = {
   }
   properties: {}
 }
-"""
-
-
-def _bicep_translator_snippet() -> str:
-    return """@description('Azure AI Translator replacing Amazon Translate')
+""",
+    "translator": """@description('Azure AI Translator replacing Amazon Translate')
 param location string = resourceGroup().location
 param accountName string = 'translator${uniqueString(resourceGroup().id)}'
 
@@ -360,11 +362,8 @@ resource translator 'Microsoft.CognitiveServices/accounts@2023-05-01' = {
   }
   properties: {}
 }
-"""
-
-
-def _bicep_speech_snippet() -> str:
-    return """@description('Azure AI Speech replacing Amazon Polly')
+""",
+    "speech": """@description('Azure AI Speech replacing Amazon Polly')
 param location string = resourceGroup().location
 param accountName string = 'speech${uniqueString(resourceGroup().id)}'
 
@@ -377,11 +376,8 @@ resource speech 'Microsoft.CognitiveServices/accounts@2023-05-01' = {
   }
   properties: {}
 }
-"""
-
-
-def _bicep_machinlearning_workspace_snippet() -> str:
-    return """@description('Azure Machine Learning replacing Amazon SageMaker')
+""",
+    "machine_learning_workspace": """@description('Azure Machine Learning replacing Amazon SageMaker')
 param location string = resourceGroup().location
 param workspaceName string = 'aml-${uniqueString(resourceGroup().id)}'
 
@@ -397,11 +393,8 @@ resource amlWorkspace 'Microsoft.MachineLearningServices/workspaces@2024-04-01'
     tier: 'Basic'
   }
 }
-"""
-
-
-def _bicep_aad_b2c_snippet() -> str:
-    return """@description('Azure AD B2C replacing Amazon Cognito')
+""",
+    "aad_b2c": """@description('Azure AD B2C replacing Amazon Cognito')
 param tenantName string = 'b2c${uniqueString(resourceGroup().id)}'
 
 resource b2cDirectory 'Microsoft.AzureActiveDirectory/b2cDirectories@2019-01-01-preview' = {
@@ -415,9 +408,8 @@ resource b2cDirectory 'Microsoft.AzureActiveDirectory/b2cDirectories@2019-01-01-
     }
   }
 }
-"""
-
-
+""",
+}
 
 
 AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
@@ -433,7 +425,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 48.5,
             "assumptions": "2 vCPU, 8 GiB, 730 hours/month",
         },
-        "bicep_template": _bicep_vm_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["vm"],
     },
     {
         "aws": ["aws lambda", "lambda", "amazon lambda", "serverless function"],
@@ -447,7 +439,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 18.0,
             "assumptions": "50M executions, 1M GB-seconds",
         },
-        "bicep_template": _bicep_functions_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["functions"],
     },
     {
         "aws": ["amazon s3", "s3", "simple storage service", "aws s3 bucket"],
@@ -461,7 +453,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 22.0,
             "assumptions": "5 TB hot data, 10M read/write operations",
         },
-        "bicep_template": _bicep_storage_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["storage"],
     },
     {
         "aws": ["amazon rds", "rds", "relational database service"],
@@ -475,7 +467,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 140.0,
             "assumptions": "General-purpose, 2 vCore, 512 GB storage",
         },
-        "bicep_template": _bicep_sql_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["sql"],
     },
     {
         "aws": ["amazon dynamodb", "dynamodb"],
@@ -489,7 +481,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 55.0,
             "assumptions": "1000 RUs/s, multi-region write disabled",
         },
-        "bicep_template": _bicep_cosmos_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["cosmos"],
     },
     {
         "aws": ["amazon api gateway", "api gateway", "aws api gateway"],
@@ -503,7 +495,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 40.0,
             "assumptions": "3M calls/month, developer tier",
         },
-        "bicep_template": _bicep_api_management_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["api_management"],
     },
     {
         "aws": ["amazon vpc", "vpc", "virtual private cloud"],
@@ -517,7 +509,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 0.0,
             "assumptions": "Baseline VNet/subnet construct",
         },
-        "bicep_template": _bicep_vnet_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["vnet"],
     },
     {
         "aws": ["amazon ecs", "amazon eks", "ecs", "eks", "fargate"],
@@ -531,33 +523,7 @@ AWS_TO_AZURE_SERVICE_CATALOG: Sequence[Dict[str, Any]] = [
             "azure_monthly": 70.0,
             "assumptions": "Two-node pool, burstable instances",
         },
-        "bicep_template": """@description('Azure Kubernetes Service replacing Amazon ECS/EKS')
-param location string = resourceGroup().location
-param clusterName string = 'aks-${uniqueString(resourceGroup().id)}'
-
-resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
-  name: clusterName
-  location: location
-  sku: {
-    name: 'Base'
-    tier: 'Standard'
-  }
-  properties: {
-    dnsPrefix: clusterName
-    kubernetesVersion: '1.29.0'
-    agentPoolProfiles: [
-      {
-        name: 'systempool'
-        count: 2
-        vmSize: 'Standard_B4ms'
-        osType: 'Linux'
-        type: 'VirtualMachineScaleSets'
-        mode: 'System'
-      }
-    ]
-  }
-}
-""",
+        "bicep_template": _BICEP_TEMPLATES["aks"],
     },
     {
         "aws": ["amazon sqs", "sqs", "amazon sns", "sns", "simple queue service", "simple notification service"],
@@ -571,7 +537,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 4.5,
             "assumptions": "10M operations, 1 Premium namespace",
         },
-        "bicep_template": _bicep_service_bus_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["service_bus"],
     },
     {
         "aws": ["amazon cloudfront", "cloudfront", "cdn"],
@@ -585,7 +551,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 32.0,
             "assumptions": "10 TB egress, standard rules engine",
         },
-        "bicep_template": _bicep_front_door_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["front_door"],
     },
     {
         "aws": ["aws amplify", "amplify", "amazon amplify"],
@@ -599,7 +565,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 17.0,
             "assumptions": "Standard tier, 1 custom domain",
         },
-        "bicep_template": _bicep_static_web_app_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["static_web_app"],
     },
     {
         "aws": ["amazon cognito", "cognito"],
@@ -613,7 +579,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 28.0,
             "assumptions": "50k MAU, standard tier",
         },
-        "bicep_template": _bicep_aad_b2c_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["aad_b2c"],
     },
     {
         "aws": ["aws step functions", "step functions"],
@@ -627,7 +593,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 42.0,
             "assumptions": "5M actions per month",
         },
-        "bicep_template": _bicep_logic_app_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["logic_app"],
     },
     {
         "aws": ["amazon textract", "textract"],
@@ -641,7 +607,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 58.0,
             "assumptions": "1M pages analyzed",
         },
-        "bicep_template": _bicep_form_recognizer_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["form_recognizer"],
     },
     {
         "aws": ["amazon rekognition", "rekognition"],
@@ -655,7 +621,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 39.0,
             "assumptions": "2M images per month",
         },
-        "bicep_template": _bicep_vision_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["vision"],
     },
     {
         "aws": ["amazon sagemaker", "sagemaker"],
@@ -669,7 +635,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 115.0,
             "assumptions": "Basic dev workspace",
         },
-        "bicep_template": _bicep_machinlearning_workspace_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["machine_learning_workspace"],
     },
     {
         "aws": ["amazon translate", "translate"],
@@ -683,7 +649,7 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 24.0,
             "assumptions": "20M characters per month",
         },
-        "bicep_template": _bicep_translator_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["translator"],
     },
     {
         "aws": ["amazon polly", "polly"],
@@ -697,34 +663,86 @@ resource aks 'Microsoft.ContainerService/managedClusters@2024-01-01' = {
             "azure_monthly": 34.0,
             "assumptions": "5M characters per month",
         },
-        "bicep_template": _bicep_speech_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["speech"],
     },
 ]
 
-AWS_LOOKUP: Dict[str, Dict[str, Any]] = {}
-for entry in AWS_TO_AZURE_SERVICE_CATALOG:
-    for alias in entry.get("aws", []):
-        AWS_LOOKUP[_normalize(alias)] = entry
+_COST_DEFAULTS: Dict[str, Any] = {"currency": "USD", "aws_monthly": None, "azure_monthly": None, "assumptions": None}
+_COST_FIELDS = itemgetter("currency", "aws_monthly", "azure_monthly", "assumptions")
+
+
+def _summary_template(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Per-node price summary fields that depend only on the catalog entry."""
+    currency, aws_price, azure_price, assumptions = _COST_FIELDS({**_COST_DEFAULTS, **entry["cost"]})
+    try:
+        delta = azure_price - aws_price
+    except TypeError:
+        delta = None
+    return {
+        "azure_service": entry["azure_service"],
+        "currency": currency,
+        "aws_monthly": aws_price,
+        "azure_monthly": azure_price,
+        "delta": delta,
+        "assumptions": assumptions,
+    }
+
+
+# Intern the catalog's identifying strings (node data is compared against and
+# populated from them for every migrated node).
+for _entry in AWS_TO_AZURE_SERVICE_CATALOG:
+    for _key in ("azure_service", "azure_category", "azure_resource_type"):
+        _entry[_key] = sys.intern(_entry[_key])
+del _entry, _key
+
+# The fixed part of each priced entry's summary row, keyed by the entry's first
+# AWS alias and kept out of the catalog entries themselves (which
+# /migration/mappings serves as-is).
+_SUMMARY_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    entry["aws"][0]: _summary_template(entry) for entry in AWS_TO_AZURE_SERVICE_CATALOG if entry.get("cost")
+}
+
+AWS_LOOKUP: Dict[str, Dict[str, Any]] = {
+    _normalize(alias): entry for entry in AWS_TO_AZURE_SERVICE_CATALOG for alias in entry["aws"]
+}
+
+# Fuzzy resolution over the aliases in AWS_LOOKUP order. The lookahead alternation
+# reports, at every position of a title, the earliest alias starting there, and a
+# find() over the newline-joined aliases locates the earliest alias containing the
+# title, so both directions keep the first-alias-wins order of a linear scan.
+_ALIASES: List[str] = list(AWS_LOOKUP)
+_ALIAS_INDEX: Dict[str, int] = {alias: index for index, alias in enumerate(_ALIASES)}
+_ALIAS_RE = re.compile("(?=(" + "|".join(map(re.escape, _ALIASES)) + "))")
+_ALIAS_BLOB = "\n".join(_ALIASES)
+_ALIAS_OFFSETS: List[int] = [0, *accumulate(len(alias) + 1 for alias in _ALIASES[:-1])]
 
 
 def _as_number(value: Any) -> Optional[float]:
+    # Catalog prices are already numeric; only strings need the try/except path.
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return None
     try:
         return float(value)
     except (TypeError, ValueError):
         return None
 
 
-def _build_cost_summary(price_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _build_cost_summary(price_rows: List[Dict[str, Any]], _to_number=_as_number) -> Dict[str, Any]:
     if not price_rows:
         return {}
 
     numeric_rows: List[Dict[str, Any]] = []
-    currency = "USD"
+    aws_total = azure_total = 0
+    # The catalog prices everything in one currency; the last row naming one wins.
+    currency = next(
+        (row["currency"] for row in reversed(price_rows) if isinstance(row.get("currency"), str)),
+        "USD",
+    )
     for row in price_rows:
-        aws_price = _as_number(row.get("aws_monthly"))
-        azure_price = _as_number(row.get("azure_monthly"))
-        if isinstance(row.get("currency"), str):
-            currency = row["currency"]
+        aws_price = _to_number(row.get("aws_monthly"))
+        azure_price = _to_number(row.get("azure_monthly"))
         if aws_price is None and azure_price is None:
             continue
 
@@ -751,12 +769,15 @@ def _build_cost_summary(price_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
             entry["savings_percent"] = None
 
         numeric_rows.append(entry)
+        # Totals are accumulated in the same pass that normalises the rows
+        if aws_price:
+            aws_total += aws_price
+        if azure_price:
+            azure_total += azure_price
 
     if not numeric_rows:
         return {}
 
-    aws_total = sum(filter(None, (row.get("aws_monthly") for row in numeric_rows)))
-    azure_total = sum(filter(None, (row.get("azure_monthly") for row in numeric_rows)))
     delta_total = azure_total - aws_total
     savings = aws_total - azure_total
     savings_percent = None
@@ -771,13 +792,13 @@ def _build_cost_summary(price_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
     else:
         verdict = "Monthly costs are roughly equivalent between AWS and Azure for this workload."
 
-    summary_lines = [
-        f"- **AWS monthly**: {currency} {aws_total:,.2f}",
-        f"- **Azure monthly**: {currency} {azure_total:,.2f}",
-        f"- **Delta**: {currency} {delta_total:,.2f}",
-    ]
+    summary_markdown = (
+        f"- **AWS monthly**: {currency} {aws_total:,.2f}\n"
+        f"- **Azure monthly**: {currency} {azure_total:,.2f}\n"
+        f"- **Delta**: {currency} {delta_total:,.2f}"
+    )
     if savings_percent is not None:
-        summary_lines.append(f"- **Projected savings**: {savings_percent:+.2f}% vs AWS")
+        summary_markdown += f"\n- **Projected savings**: {savings_percent:+.2f}% vs AWS"
 
     return {
         "currency": currency,
@@ -787,7 +808,7 @@ def _build_cost_summary(price_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
         "savings": savings,
         "savings_percent": savings_percent,
         "verdict": verdict,
-        "summary_markdown": "\n".join(summary_lines),
+        "summary_markdown": summary_markdown,
         "per_service": numeric_rows,
     }
 
@@ -831,30 +852,75 @@ SERVICE_TYPE_TO_AWS: Dict[str, str] = {
 }
 
 
-def _resolve_mapping(service_name: str) -> Optional[Dict[str, Any]]:
-    normalized = _normalize(service_name)
+# Memoised so re-migrating a diagram (UI refreshes, API retries) skips the fuzzy
+# alias scan for every title seen before; the entries returned are shared catalog
+# constants, so no copying is needed on a hit.
+@lru_cache(maxsize=1024)
+def _resolve_mapping(
+    service_name: str,
+    _lookup: Dict[str, Dict[str, Any]] = AWS_LOOKUP,
+    _norm=_normalize,
+) -> Optional[Dict[str, Any]]:
+    # The defaults bind the lookup table and normaliser once at definition time.
+    normalized = _norm(service_name)
     if not normalized:
         return None
-    mapping = AWS_LOOKUP.get(normalized)
+    mapping = _lookup.get(normalized)
     if mapping:
         return mapping
-    # Fuzzy fallback: find the first alias contained within the name.
-    for alias, entry in AWS_LOOKUP.items():
-        if alias and (alias in normalized or normalized in alias):
-            return entry
+    # Fuzzy fallback: the first alias contained within the name, or containing it.
+    best = min((_ALIAS_INDEX[match.group(1)] for match in _ALIAS_RE.finditer(normalized)), default=len(_ALIASES))
+    position = _ALIAS_BLOB.find(normalized)
+    if position >= 0:
+        best = min(best, bisect_right(_ALIAS_OFFSETS, position) - 1)
+    if best < len(_ALIASES):
+        return _lookup[_ALIASES[best]]
     return None
 
 
+# SERVICE_TYPE_TO_AWS resolved against the catalog once at import; service types
+# whose AWS service has no Azure mapping are left out.
+SERVICE_TYPE_TO_MAPPING: Dict[str, Dict[str, Any]] = {
+    service_type: mapping
+    for service_type, aws_service_name in SERVICE_TYPE_TO_AWS.items()
+    if (mapping := _resolve_mapping(aws_service_name))
+}
+
+
+def _copy_node(node: Any) -> Any:
+    """Copy the parts of a node the migration mutates, sharing everything else."""
+    if not isinstance(node, dict):
+        return node
+    node = dict(node)
+    data = node.get("data")
+    if isinstance(data, dict):
+        data = dict(data)
+        badges = data.get("badges")
+        if isinstance(badges, list):
+            data["badges"] = badges.copy()
+        node["data"] = data
+    return node
+
+
 def migrate_aws_diagram(diagram: Dict[str, Any] | None) -> AwsMigrationResult:
     """Convert AWS-tagged nodes inside a diagram into Azure equivalents."""
     if not isinstance(diagram, dict):
         return AwsMigrationResult(diagram={}, applied=False)
 
-    nodes = deepcopy(diagram.get("nodes") or [])
+    nodes = [_copy_node(node) for node in diagram.get("nodes") or []]
     converted_nodes: List[Dict[str, Any]] = []
-    price_summary: List[Dict[str, Any]] = []
-    bicep_snippets: List[Dict[str, Any]] = []
+    migrated: List[Tuple[Any, Any, Dict[str, Any]]] = []
     unmapped_services: List[Dict[str, Any]] = []
+    # Large diagrams repeat the same titles (hundreds of "Amazon EC2" nodes)
+    norm_cache: Dict[str, str] = {}
+    # Loop-invariant callables bound to locals so each use is a LOAD_FAST
+    normalize = _normalize
+    intern = sys.intern
+    lookup_service_type = SERVICE_TYPE_TO_MAPPING.get
+    resolve_mapping = _resolve_mapping
+    add_converted = converted_nodes.append
+    add_migrated = migrated.append
+    add_unmapped = unmapped_services.append
 
     for node in nodes:
         if not isinstance(node, dict):
@@ -862,103 +928,102 @@ def migrate_aws_diagram(diagram: Dict[str, Any] | None) -> AwsMigrationResult:
         data = node.get("data") or {}
         if not isinstance(data, dict):
             continue
-        provider_hint = _normalize(str(data.get("provider", "")))
+        provider_hint = normalize(str(data.get("provider", "")))
         title = data.get("title") or data.get("label") or node.get("id") or ""
-        normalized_title = _normalize(str(title))
+        raw_title = str(title)
+        normalized_title = norm_cache.get(raw_title)
+        if normalized_title is None:
+            normalized_title = norm_cache[raw_title] = normalize(raw_title)
         
         # Get serviceType for better matching on imported inventory
         service_type = data.get("serviceType") or ""
+        if isinstance(service_type, str):
+            service_type = intern(service_type)
 
         if provider_hint not in ("aws",) and not normalized_title:
             continue
 
-        original_snapshot = {
-            "title": data.get("title"),
-            "category": data.get("category"),
-            "iconPath": data.get("iconPath"),
-            "provider": data.get("provider", "aws"),
-            "serviceType": service_type,
-        }
-
-        # Try to resolve mapping - first try serviceType, then title
-        mapping = None
-        
-        # Try serviceType-based mapping first (more reliable for imported inventory)
-        if service_type and service_type in SERVICE_TYPE_TO_AWS:
-            aws_service_name = SERVICE_TYPE_TO_AWS[service_type]
-            mapping = _resolve_mapping(aws_service_name)
-        
-        # Fall back to title-based mapping
+        # Try serviceType-based mapping first (more reliable for imported inventory),
+        # then fall back to title-based mapping
+        mapping = lookup_service_type(service_type) if service_type else None
         if not mapping:
-            mapping = _resolve_mapping(normalized_title)
+            mapping = resolve_mapping(normalized_title)
         
         if not mapping:
             data.setdefault("badges", [])
             if "Unmapped" not in data["badges"]:
                 data["badges"].append("Unmapped")
             data.setdefault("notes", "AWS service not yet mapped to an Azure equivalent")
-            unmapped_services.append(
+            add_unmapped(
                 {
                     "node_id": node.get("id"),
-                    "aws_service": original_snapshot["title"],
+                    "aws_service": data.get("title"),
                     "reason": "No Azure mapping available",
                 }
             )
             continue
 
-        data["awsOriginal"] = original_snapshot
+        node_id = node.get("id")
+        original_title = data.get("title")
+        azure_service = mapping["azure_service"]
+        resource_type = mapping["azure_resource_type"]
+
+        data["awsOriginal"] = {
+            "title": original_title,
+            "category": data.get("category"),
+            "iconPath": data.get("iconPath"),
+            "provider": data.get("provider", "aws"),
+            "serviceType": service_type,
+        }
         data["provider"] = "azure"
-        data["title"] = mapping["azure_service"]
+        data["title"] = azure_service
         data["category"] = mapping["azure_category"]
-        data["resourceType"] = mapping["azure_resource_type"]
+        data["resourceType"] = resource_type
         data.setdefault("badges", [])
-        data["badges"] = list(set([*data["badges"], "Migrated"]))
+        if "Migrated" not in data["badges"]:
+            data["badges"].append("Migrated")
         node["data"] = data
 
-        converted_nodes.append(
+        add_converted(
             {
-                "node_id": node.get("id"),
-                "aws_service": original_snapshot["title"],
-                "azure_service": mapping["azure_service"],
-                "resource_type": mapping["azure_resource_type"],
+                "node_id": node_id,
+                "aws_service": original_title,
+                "azure_service": azure_service,
+                "resource_type": resource_type,
                 "description": mapping.get("description"),
             }
         )
-
-        if mapping.get("cost"):
-            cost = mapping["cost"]
-            summary_entry = {
-                "node_id": node.get("id"),
-                "aws_service": original_snapshot["title"],
-                "azure_service": mapping["azure_service"],
-                "currency": cost.get("currency", "USD"),
-                "aws_monthly": cost.get("aws_monthly"),
-                "azure_monthly": cost.get("azure_monthly"),
-                "delta": None,
-                "assumptions": cost.get("assumptions"),
-            }
-            aws_price = cost.get("aws_monthly")
-            azure_price = cost.get("azure_monthly")
-            if isinstance(aws_price, (int, float)) and isinstance(azure_price, (int, float)):
-                summary_entry["delta"] = azure_price - aws_price
-            price_summary.append(summary_entry)
-
-        if mapping.get("bicep_template"):
-            bicep_snippets.append(
-                {
-                    "aws_service": original_snapshot["title"],
-                    "azure_service": mapping["azure_service"],
-                    "snippet": mapping["bicep_template"],
-                }
-            )
-
-    updated_diagram = dict(diagram)
-    updated_diagram["nodes"] = nodes
+        add_migrated((node_id, original_title, mapping))
+
+    if not migrated:
+        # Nothing to price or template; the result's defaults cover every other field
+        if unmapped_services and logger.isEnabledFor(logging.INFO):
+            logger.info("Found %s unmapped AWS services", len(unmapped_services))
+        return AwsMigrationResult(diagram={**diagram, "nodes": nodes}, unmapped_services=unmapped_services)
+
+    # The price rows and snippets follow the converted nodes one-to-one (minus
+    # entries without a cost or template), so build them in one sized pass each.
+    price_summary = [
+        {"node_id": node_id, "aws_service": original_title, **summary_template}
+        for node_id, original_title, mapping in migrated
+        if (summary_template := _SUMMARY_TEMPLATES.get(mapping["aws"][0]))
+    ]
+    bicep_snippets = [
+        {
+            "aws_service": original_title,
+            "azure_service": mapping["azure_service"],
+            "snippet": snippet,
+        }
+        for _, original_title, mapping in migrated
+        if (snippet := mapping.get("bicep_template"))
+    ]
+    updated_diagram = {**diagram, "nodes": nodes}
     applied = bool(converted_nodes)
-    if applied:
-        logger.info("Migrated %s AWS nodes to Azure equivalents", len(converted_nodes))
-    if unmapped_services:
-        logger.info("Found %s unmapped AWS services", len(unmapped_services))
+    if logger.isEnabledFor(logging.INFO):
+        if applied:
+            logger.info("Migrated %s AWS nodes to Azure equivalents", len(converted_nodes))
+        if unmapped_services:
+            logger.info("Found %s unmapped AWS services", len(unmapped_services))
     cost_summary = _build_cost_summary(price_summary)
     return AwsMigrationResult(
         diagram=updated_diagram,
@@ -9,11 +9,13 @@ in the UI or downstream reports.
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 import re
-from typing import Any, Dict, List, Optional, Sequence
+import sys
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -31,14 +33,25 @@ class GcpMigrationResult:
     applied: bool = False
 
 
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+# Byte table mapping everything but [a-z0-9] to a space, for the ASCII translate fast path
+_NORMALIZE_TABLE = bytes(c if chr(c) in "abcdefghijklmnopqrstuvwxyz0123456789" else 0x20 for c in range(256))
+
+
+@lru_cache(maxsize=2048)
 def _normalize(value: str | None) -> str:
     if not value:
         return ""
-    return re.sub(r"[^a-z0-9]+", " ", value.lower()).strip()
+    lowered = value.lower()
+    # Interned so catalog lookups on a matching name succeed on identity
+    if not lowered.isascii():
+        return sys.intern(_NORMALIZE_RE.sub(" ", lowered).strip())
+    return sys.intern(" ".join(lowered.encode("ascii").translate(_NORMALIZE_TABLE).decode("ascii").split()))
 
 
-def _bicep_vm_snippet() -> str:
-    return """@description('Virtual machine that replaces the GCP Compute Engine instance')
+# Canned Bicep snippets surfaced alongside each migrated service, keyed by template name.
+_BICEP_TEMPLATES: Dict[str, str] = {
+    "vm": """@description('Virtual machine that replaces the GCP Compute Engine instance')
 param location string = resourceGroup().location
 param vmName string = 'vm-${uniqueString(resourceGroup().id)}'
 
@@ -73,11 +86,8 @@ resource vm 'Microsoft.Compute/virtualMachines@2023-09-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_functions_snippet() -> str:
-    return """@description('Azure Function replacing GCP Cloud Functions')
+""",
+    "functions": """@description('Azure Function replacing GCP Cloud Functions')
 param location string = resourceGroup().location
 param storageAccountName string
 param functionAppName string = 'fn-${uniqueString(resourceGroup().id)}'
@@ -117,11 +127,8 @@ resource functionApp 'Microsoft.Web/sites@2022-09-01' = {
     }
   }
 }
-"""
-
-
-def _bicep_storage_snippet() -> str:
-    return """@description('Azure Storage Account replacing GCP Cloud Storage')
+""",
+    "storage": """@description('Azure Storage Account replacing GCP Cloud Storage')
 param location string = resourceGroup().location
 param storageAccountName string = 'st${uniqueString(resourceGroup().id)}'
 
@@ -143,11 +150,8 @@ resource blobService 'Microsoft.Storage/storageAccounts/blobServices@2023-01-01'
   parent: storageAccount
   name: 'default'
 }
-"""
-
-
-def _bicep_sql_snippet() -> str:
-    return """@description('Azure SQL Database replacing GCP Cloud SQL')
+""",
+    "sql": """@description('Azure SQL Database replacing GCP Cloud SQL')
 param location string = resourceGroup().location
 param sqlServerName string = 'sql-${uniqueString(resourceGroup().id)}'
 param databaseName string = 'sqldb-main'
@@ -171,11 +175,8 @@ resource sqlDatabase 'Microsoft.Sql/servers/databases@2023-05-01-preview' = {
     tier: 'Basic'
   }
 }
-"""
-
-
-def _bicep_cosmos_snippet() -> str:
-    return """@description('Azure Cosmos DB replacing GCP Firestore/Datastore')
+""",
+    "cosmos": """@description('Azure Cosmos DB replacing GCP Firestore/Datastore')
 param location string = resourceGroup().location
 param cosmosAccountName string = 'cosmos-${uniqueString(resourceGroup().id)}'
 
@@ -195,11 +196,8 @@ resource cosmosAccount 'Microsoft.DocumentDB/databaseAccounts@2023-11-15' = {
     }
   }
 }
-"""
-
-
-def _bicep_aks_snippet() -> str:
-    return """@description('Azure Kubernetes Service replacing GCP GKE')
+""",
+    "aks": """@description('Azure Kubernetes Service replacing GCP GKE')
 param location string = resourceGroup().location
 param aksClusterName string = 'aks-${uniqueString(resourceGroup().id)}'
 
@@ -221,11 +219,8 @@ resource aksCluster 'Microsoft.ContainerService/managedClusters@2023-11-01' = {
     ]
   }
 }
-"""
-
-
-def _bicep_pubsub_snippet() -> str:
-    return """@description('Azure Service Bus replacing GCP Pub/Sub')
+""",
+    "pubsub": """@description('Azure Service Bus replacing GCP Pub/Sub')
 param location string = resourceGroup().location
 param serviceBusName string = 'sb-${uniqueString(resourceGroup().id)}'
 
@@ -241,11 +236,8 @@ resource topic 'Microsoft.ServiceBus/namespaces/topics@2022-10-01-preview' = {
   parent: serviceBusNamespace
   name: 'messages'
 }
-"""
-
-
-def _bicep_redis_snippet() -> str:
-    return """@description('Azure Cache for Redis replacing GCP Memorystore')
+""",
+    "redis": """@description('Azure Cache for Redis replacing GCP Memorystore')
 param location string = resourceGroup().location
 param redisName string = 'redis-${uniqueString(resourceGroup().id)}'
 
@@ -262,48 +254,35 @@ resource redisCache 'Microsoft.Cache/redis@2023-08-01' = {
     minimumTlsVersion: '1.2'
   }
 }
-"""
-
-
-def _build_cost_summary(price_rows: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Aggregate monthly cost totals and compute deltas."""
-    gcp_total = 0.0
-    azure_total = 0.0
-    currency = "USD"
+""",
+}
 
-    for row in price_rows:
-        gcp_val = row.get("gcp_monthly")
-        azure_val = row.get("azure_monthly")
-        if isinstance(gcp_val, (int, float)):
-            gcp_total += gcp_val
-        if isinstance(azure_val, (int, float)):
-            azure_total += azure_val
-        if row.get("currency"):
-            currency = row["currency"]
 
-    delta = azure_total - gcp_total
+def _build_cost_summary(gcp_cents: int, azure_cents: int, currency: str) -> Dict[str, Any]:
+    """Compute deltas and the verdict from the monthly cost totals, given in cents."""
+    delta_cents = azure_cents - gcp_cents
     savings_pct = 0.0
-    if gcp_total > 0:
-        savings_pct = (delta / gcp_total) * 100
+    if gcp_cents > 0:
+        savings_pct = round(delta_cents / gcp_cents * 100, 2)
 
-    verdict = "Comparable costs"
-    if delta < -10:
-        verdict = "Azure is more cost-effective"
-    elif delta > 10:
-        verdict = "GCP is more cost-effective"
+    verdict = (
+        "Azure is more cost-effective" if delta_cents < -1000
+        else "GCP is more cost-effective" if delta_cents > 1000
+        else "Comparable costs"
+    )
 
     return {
-        "gcp_monthly_total": round(gcp_total, 2),
-        "azure_monthly_total": round(azure_total, 2),
-        "delta": round(delta, 2),
-        "savings_percent": round(savings_pct, 2),
+        "gcp_monthly_total": gcp_cents / 100,
+        "azure_monthly_total": azure_cents / 100,
+        "delta": delta_cents / 100,
+        "savings_percent": savings_pct,
         "currency": currency,
         "verdict": verdict,
     }
 
 
 # Comprehensive GCP to Azure service mappings
-GCP_TO_AZURE_MAPPINGS = {
+GCP_TO_AZURE_MAPPINGS: Dict[str, Mapping[str, Any]] = {
     # Compute
     "compute engine": {
         "azure_service": "Virtual Machine",
@@ -311,7 +290,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Compute/virtualMachines",
         "description": "VM instances for compute workloads",
         "cost": {"gcp_monthly": 25, "azure_monthly": 30, "currency": "USD", "assumptions": "e2-medium vs Standard_B2s"},
-        "bicep_template": _bicep_vm_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["vm"],
     },
     "gce": {
         "azure_service": "Virtual Machine",
@@ -319,7 +298,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Compute/virtualMachines",
         "description": "VM instances for compute workloads",
         "cost": {"gcp_monthly": 25, "azure_monthly": 30, "currency": "USD", "assumptions": "e2-medium vs Standard_B2s"},
-        "bicep_template": _bicep_vm_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["vm"],
     },
     "app engine": {
         "azure_service": "App Service",
@@ -334,7 +313,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Web/sites",
         "description": "Serverless compute functions",
         "cost": {"gcp_monthly": 0.40, "azure_monthly": 0.20, "currency": "USD", "assumptions": "1M executions/month"},
-        "bicep_template": _bicep_functions_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["functions"],
     },
     "cloud run": {
         "azure_service": "Container Apps",
@@ -351,7 +330,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Storage/storageAccounts",
         "description": "Object storage service",
         "cost": {"gcp_monthly": 20, "azure_monthly": 18, "currency": "USD", "assumptions": "Standard LRS, 1TB"},
-        "bicep_template": _bicep_storage_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["storage"],
     },
     "gcs": {
         "azure_service": "Azure Storage (Blob)",
@@ -359,7 +338,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Storage/storageAccounts",
         "description": "Object storage service",
         "cost": {"gcp_monthly": 20, "azure_monthly": 18, "currency": "USD", "assumptions": "Standard LRS, 1TB"},
-        "bicep_template": _bicep_storage_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["storage"],
     },
     "persistent disk": {
         "azure_service": "Managed Disks",
@@ -383,7 +362,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Sql/servers/databases",
         "description": "Managed relational database",
         "cost": {"gcp_monthly": 45, "azure_monthly": 50, "currency": "USD", "assumptions": "db-n1-standard-1 vs S1"},
-        "bicep_template": _bicep_sql_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["sql"],
     },
     "cloud spanner": {
         "azure_service": "Azure Cosmos DB",
@@ -391,7 +370,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.DocumentDB/databaseAccounts",
         "description": "Globally distributed database",
         "cost": {"gcp_monthly": 900, "azure_monthly": 700, "currency": "USD", "assumptions": "Multi-region, 1000 RU/s"},
-        "bicep_template": _bicep_cosmos_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["cosmos"],
     },
     "firestore": {
         "azure_service": "Azure Cosmos DB",
@@ -399,7 +378,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.DocumentDB/databaseAccounts",
         "description": "NoSQL document database",
         "cost": {"gcp_monthly": 50, "azure_monthly": 45, "currency": "USD", "assumptions": "Native mode, 1000 RU/s"},
-        "bicep_template": _bicep_cosmos_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["cosmos"],
     },
     "datastore": {
         "azure_service": "Azure Cosmos DB",
@@ -407,7 +386,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.DocumentDB/databaseAccounts",
         "description": "NoSQL database service",
         "cost": {"gcp_monthly": 50, "azure_monthly": 45, "currency": "USD", "assumptions": "1000 RU/s"},
-        "bicep_template": _bicep_cosmos_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["cosmos"],
     },
     "bigtable": {
         "azure_service": "Azure Cosmos DB (Table API)",
@@ -429,7 +408,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.Cache/redis",
         "description": "In-memory data store",
         "cost": {"gcp_monthly": 45, "azure_monthly": 40, "currency": "USD", "assumptions": "Basic tier 1GB"},
-        "bicep_template": _bicep_redis_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["redis"],
     },
     
     # Containers & Kubernetes
@@ -439,7 +418,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.ContainerService/managedClusters",
         "description": "Managed Kubernetes clusters",
         "cost": {"gcp_monthly": 75, "azure_monthly": 0, "currency": "USD", "assumptions": "Cluster management free on Azure"},
-        "bicep_template": _bicep_aks_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["aks"],
     },
     "gke": {
         "azure_service": "Azure Kubernetes Service",
@@ -447,7 +426,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.ContainerService/managedClusters",
         "description": "Managed Kubernetes clusters",
         "cost": {"gcp_monthly": 75, "azure_monthly": 0, "currency": "USD", "assumptions": "Cluster management free on Azure"},
-        "bicep_template": _bicep_aks_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["aks"],
     },
     "container registry": {
         "azure_service": "Azure Container Registry",
@@ -508,7 +487,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.ServiceBus/namespaces",
         "description": "Message queue and pub/sub",
         "cost": {"gcp_monthly": 40, "azure_monthly": 35, "currency": "USD", "assumptions": "Standard tier"},
-        "bicep_template": _bicep_pubsub_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["pubsub"],
     },
     "pubsub": {
         "azure_service": "Azure Service Bus",
@@ -516,7 +495,7 @@ GCP_TO_AZURE_MAPPINGS = {
         "azure_resource_type": "Microsoft.ServiceBus/namespaces",
         "description": "Message queue and pub/sub",
         "cost": {"gcp_monthly": 40, "azure_monthly": 35, "currency": "USD", "assumptions": "Standard tier"},
-        "bicep_template": _bicep_pubsub_snippet(),
+        "bicep_template": _BICEP_TEMPLATES["pubsub"],
     },
     "cloud tasks": {
         "azure_service": "Azure Queue Storage",
@@ -687,16 +666,64 @@ GCP_TO_AZURE_MAPPINGS = {
 }
 
 
+def _summary_template(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """Per-node price summary fields that depend only on the catalog entry."""
+    cost = entry["cost"]
+    gcp_price = cost.get("gcp_monthly")
+    azure_price = cost.get("azure_monthly")
+    delta = None
+    if isinstance(gcp_price, (int, float)) and isinstance(azure_price, (int, float)):
+        delta = azure_price - gcp_price
+    return {
+        "azure_service": entry["azure_service"],
+        "currency": cost.get("currency", "USD"),
+        "gcp_monthly": gcp_price,
+        "azure_monthly": azure_price,
+        "delta": delta,
+        "assumptions": cost.get("assumptions"),
+    }
+
+
+# The catalog entries are shared by every migration, so expose them as
+# read-only views. The keys are interned to match the interned names
+# _normalize returns.
+for _mapping in GCP_TO_AZURE_MAPPINGS.values():
+    if isinstance(_mapping.get("cost"), dict):
+        _mapping["cost"] = MappingProxyType(_mapping["cost"])
+GCP_TO_AZURE_MAPPINGS = {
+    sys.intern(_key): MappingProxyType(_mapping) for _key, _mapping in GCP_TO_AZURE_MAPPINGS.items()
+}
+del _mapping
+
+
+def _price_row(entry: Mapping[str, Any]) -> Tuple[Mapping[str, Any], int, int]:
+    """Summary template of a priced entry plus its GCP and Azure prices in cents."""
+    template = _summary_template(entry)
+    # Prices in whole cents for the running totals; anything non-numeric counts as 0
+    gcp_cents, azure_cents = (
+        round(price * 100) if isinstance(price, (int, float)) else 0
+        for price in (template["gcp_monthly"], template["azure_monthly"])
+    )
+    return MappingProxyType(template), gcp_cents, azure_cents
+
+
+# Precomputed price rows, keyed by catalog key and kept out of the catalog
+# entries themselves (which /migration/mappings serves as-is).
+_PRICE_ROWS: Dict[str, Tuple[Mapping[str, Any], int, int]] = {
+    key: _price_row(mapping) for key, mapping in GCP_TO_AZURE_MAPPINGS.items() if mapping.get("cost")
+}
+
+
 # Service type to GCP service name mapping for imported inventory
 SERVICE_TYPE_TO_GCP: Dict[str, str] = {
     "virtual_machine": "compute engine",
     "instance_template": "compute engine",
     "instance_group": "compute engine",
     "disk": "persistent disk",
-    "vpc": "virtual private cloud",
-    "subnet": "virtual private cloud",
+    "vpc": "cloud vpc",
+    "subnet": "cloud vpc",
     "firewall": "cloud armor",
-    "external_ip": "virtual private cloud",
+    "external_ip": "cloud vpc",
     "load_balancer": "cloud load balancing",
     "backend_service": "cloud load balancing",
     "url_map": "cloud load balancing",
@@ -713,7 +740,7 @@ SERVICE_TYPE_TO_GCP: Dict[str, str] = {
     "pubsub_subscription": "cloud pub/sub",
     "cloud_tasks": "cloud tasks",
     "secret_manager": "secret manager",
-    "cloud_kms": "cloud key management",
+    "cloud_kms": "cloud kms",
     "service_account": "cloud iam",
     "monitoring_alert": "cloud monitoring",
     "logging_sink": "cloud logging",
@@ -721,85 +748,116 @@ SERVICE_TYPE_TO_GCP: Dict[str, str] = {
 }
 
 
-def _resolve_mapping(service_name: str) -> Optional[Dict[str, Any]]:
-    """Attempt to find a GCP→Azure mapping for the normalized service name."""
+# Candidates for keys contained in the service name, longest key first (ties
+# keep catalog order)
+_KEYS_BY_LENGTH: List[str] = sorted(GCP_TO_AZURE_MAPPINGS, key=len, reverse=True)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_key(service_name: str) -> Optional[str]:
+    """Attempt to find the GCP→Azure catalog key for the normalized service name."""
     normalized = _normalize(service_name)
     if not normalized:
         return None
 
     # Direct match
     if normalized in GCP_TO_AZURE_MAPPINGS:
-        return GCP_TO_AZURE_MAPPINGS[normalized]
+        return normalized
+
+    # Catalog key inside the name, longest first so "cloud sql on gce" resolves
+    # to Cloud SQL rather than Compute Engine
+    for key in _KEYS_BY_LENGTH:
+        if key in normalized:
+            return key
 
-    # Partial match
-    for key, mapping in GCP_TO_AZURE_MAPPINGS.items():
-        if key in normalized or normalized in key:
-            return mapping
+    # Name inside a catalog key, in catalog order
+    for key in GCP_TO_AZURE_MAPPINGS:
+        if normalized in key:
+            return key
 
     return None
 
 
+# SERVICE_TYPE_TO_GCP resolved against the catalog once at import; service types
+# whose GCP service has no Azure mapping are left out.
+SERVICE_TYPE_TO_KEY: Dict[str, str] = {
+    service_type: key
+    for service_type, gcp_service in SERVICE_TYPE_TO_GCP.items()
+    if (key := _resolve_key(gcp_service))
+}
+
+
 def migrate_gcp_diagram(diagram: Dict[str, Any] | None) -> GcpMigrationResult:
     """Convert GCP-tagged nodes inside a diagram into Azure equivalents."""
     if not isinstance(diagram, dict):
         return GcpMigrationResult(diagram={}, applied=False)
 
-    nodes = deepcopy(diagram.get("nodes") or [])
+    # Nodes are copied on write: untouched nodes stay shared with the input
+    # diagram, and a node is shallow-copied (with its data) before it is updated.
+    nodes = list(diagram.get("nodes") or [])
     converted_nodes: List[Dict[str, Any]] = []
     price_summary: List[Dict[str, Any]] = []
     bicep_snippets: List[Dict[str, Any]] = []
     unmapped_services: List[Dict[str, Any]] = []
+    # Cost totals are accumulated column-wise, in cents, as price rows are added
+    gcp_cents = 0
+    azure_cents = 0
 
-    for node in nodes:
+    for index, node in enumerate(nodes):
         if not isinstance(node, dict):
             continue
         data = node.get("data") or {}
         if not isinstance(data, dict):
             continue
-        provider_hint = _normalize(str(data.get("provider", "")))
+        # Nodes explicitly tagged with another provider (Azure, AWS, ...) are left
+        # alone before any title work; untagged nodes are still matched by title.
+        provider = data.get("provider")
+        provider_hint = str(provider).strip().lower() if provider else ""
+        if provider_hint and provider_hint != "gcp":
+            continue
         title = data.get("title") or data.get("label") or node.get("id") or ""
         normalized_title = _normalize(str(title))
-        
-        # Get serviceType for better matching on imported inventory
-        service_type = data.get("serviceType") or ""
-
-        if provider_hint not in ("gcp",) and not normalized_title:
+        if not provider_hint and not normalized_title:
             continue
 
-        original_snapshot = {
-            "title": data.get("title"),
-            "category": data.get("category"),
-            "iconPath": data.get("iconPath"),
-            "provider": data.get("provider", "gcp"),
-            "serviceType": service_type,
-        }
+        # Get serviceType for better matching on imported inventory
+        service_type = data.get("serviceType") or ""
 
-        # Try to resolve mapping - first try serviceType, then title
-        mapping = None
-        
-        # Try serviceType-based mapping first (more reliable for imported inventory)
-        if service_type and service_type in SERVICE_TYPE_TO_GCP:
-            gcp_service_name = SERVICE_TYPE_TO_GCP[service_type]
-            mapping = _resolve_mapping(gcp_service_name)
-        
-        # Fall back to title-based mapping
-        if not mapping:
-            mapping = _resolve_mapping(normalized_title)
+        # Try serviceType-based mapping first (more reliable for imported inventory),
+        # then fall back to title-based mapping
+        key = SERVICE_TYPE_TO_KEY.get(service_type) if service_type else None
+        if not key:
+            key = _resolve_key(normalized_title)
             
-        if not mapping:
-            data.setdefault("badges", [])
-            if "Unmapped" not in data["badges"]:
-                data["badges"].append("Unmapped")
+        node = nodes[index] = dict(node)
+        if data is node.get("data"):
+            data = node["data"] = dict(data)
+
+        if not key:
+            badges = data.setdefault("badges", [])
+            if "Unmapped" not in badges:
+                data["badges"] = badges = badges.copy()
+                badges.append("Unmapped")
             data.setdefault("notes", "GCP service not yet mapped to an Azure equivalent")
             unmapped_services.append(
                 {
                     "node_id": node.get("id"),
-                    "gcp_service": original_snapshot["title"],
+                    "gcp_service": data.get("title"),
                     "reason": "No Azure mapping available",
                 }
             )
             continue
 
+        mapping = GCP_TO_AZURE_MAPPINGS[key]
+        # The snapshot only holds the scalar fields being overwritten below, so it
+        # is read straight off the node's data with no copying.
+        original_snapshot = {
+            "title": data.get("title"),
+            "category": data.get("category"),
+            "iconPath": data.get("iconPath"),
+            "provider": data.get("provider", "gcp"),
+            "serviceType": service_type,
+        }
         data["gcpOriginal"] = original_snapshot
         data["provider"] = "azure"
         data["title"] = mapping["azure_service"]
@@ -819,23 +877,14 @@ def migrate_gcp_diagram(diagram: Dict[str, Any] | None) -> GcpMigrationResult:
             }
         )
 
-        if mapping.get("cost"):
-            cost = mapping["cost"]
-            summary_entry = {
-                "node_id": node.get("id"),
-                "gcp_service": original_snapshot["title"],
-                "azure_service": mapping["azure_service"],
-                "currency": cost.get("currency", "USD"),
-                "gcp_monthly": cost.get("gcp_monthly"),
-                "azure_monthly": cost.get("azure_monthly"),
-                "delta": None,
-                "assumptions": cost.get("assumptions"),
-            }
-            gcp_price = cost.get("gcp_monthly")
-            azure_price = cost.get("azure_monthly")
-            if isinstance(gcp_price, (int, float)) and isinstance(azure_price, (int, float)):
-                summary_entry["delta"] = azure_price - gcp_price
-            price_summary.append(summary_entry)
+        price_row = _PRICE_ROWS.get(key)
+        if price_row:
+            summary_template, gcp_price, azure_price = price_row
+            price_summary.append(
+                {"node_id": node.get("id"), "gcp_service": original_snapshot["title"], **summary_template}
+            )
+            gcp_cents += gcp_price
+            azure_cents += azure_price
 
         if mapping.get("bicep_template"):
             bicep_snippets.append(
@@ -855,7 +904,9 @@ def migrate_gcp_diagram(diagram: Dict[str, Any] | None) -> GcpMigrationResult:
     if unmapped_services:
         logger.info("Found %s unmapped GCP services", len(unmapped_services))
 
-    cost_summary = _build_cost_summary(price_summary)
+    # The last row naming a currency wins
+    currency = next((row["currency"] for row in reversed(price_summary) if row.get("currency")), "USD")
+    cost_summary = _build_cost_summary(gcp_cents, azure_cents, currency)
     return GcpMigrationResult(
         diagram=updated_diagram,
         converted_nodes=converted_nodes,
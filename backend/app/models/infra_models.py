@@ -11,7 +11,7 @@ Unified multi-cloud infrastructure models for:
 All models use Pydantic for validation and serialization.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Literal, Optional, Union
 from pydantic import BaseModel, Field
@@ -169,7 +169,7 @@ class ReverseEngineeringResult(BaseModel):
     
     # Source info
     source_provider: CloudProvider = Field(..., description="Source cloud provider")
-    import_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    import_timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 
 # -----------------------------------------------------------------------------
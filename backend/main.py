@@ -8,6 +8,7 @@ FastAPI application providing REST API and WebSocket endpoints for:
 - Azure deployment orchestration
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -81,17 +82,31 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # can inspect and raise more helpful errors.
         app.state.azure_clients = azure_clients
     
+    # Warm MCP sessions in the background so the first IaC request doesn't pay
+    # for the handshake, without holding up startup.
+    from app.deps import warm_up_mcp_tools
+    mcp_warmup = asyncio.create_task(warm_up_mcp_tools())
+
     logger.info("Backend started successfully")
     yield
     
     # Cleanup
     logger.info("Shutting down Azure Architect Backend...")
+    if not mcp_warmup.done():
+        mcp_warmup.cancel()
+        await asyncio.gather(mcp_warmup, return_exceptions=True)
     try:
         # Cleanup MCP tools
         from app.deps import cleanup_mcp_tools
         await cleanup_mcp_tools()
     except Exception as e:
         logger.warning(f"Error cleaning up MCP tools: {e}")
+
+    try:
+        from app.deps import cleanup_agent_client
+        await cleanup_agent_client()
+    except Exception as e:
+        logger.warning(f"Error cleaning up agent client: {e}")
     
     try:
         await azure_clients.cleanup()
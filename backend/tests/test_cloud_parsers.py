@@ -0,0 +1,147 @@
+"""Tests for cloud inventory provider detection and normalization."""
+
+import io
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.cloud_parsers import detect_provider, detect_provider_stream, parse_inventory
+from app.cloud_parsers.parsers import _infer_edges
+from app.models.infra_models import CloudProvider, InfraNode
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+AZURE_ITEM = {"type": "Microsoft.Web/sites", "name": "web1"}
+
+
+def test_detect_provider_markers_use_fixed_precedence():
+    # Resource Explorer wins over Cloud Asset Inventory regardless of key order
+    assert detect_provider({"ResourceIdentifiers": [], "assets": []}) is CloudProvider.AWS
+    assert detect_provider({"assets": [], "ResourceIdentifiers": []}) is CloudProvider.AWS
+
+
+def test_detect_provider_first_item_checks_precede_markers():
+    assert detect_provider({"value": [AZURE_ITEM], "assets": []}) is CloudProvider.AZURE
+    assert detect_provider({"resources": [AZURE_ITEM], "ResourceIdentifiers": []}) is CloudProvider.AZURE
+    cloudformation = {"Resources": {"Web": {"Type": "AWS::EC2::Instance"}}, "assets": []}
+    assert detect_provider(cloudformation) is CloudProvider.AWS
+
+
+def test_detect_provider_formats():
+    assert detect_provider({"value": [AZURE_ITEM]}) is CloudProvider.AZURE
+    assert detect_provider({"resources": [{"assetType": "compute.googleapis.com/Instance"}]}) is CloudProvider.GCP
+    assert detect_provider({"ResourceIdentifiers": []}) is CloudProvider.AWS
+    assert detect_provider({"assets": []}) is CloudProvider.GCP
+    assert detect_provider([{"type": "AWS::S3::Bucket"}]) is CloudProvider.AWS
+    assert detect_provider([{"assetType": "storage.googleapis.com/Bucket"}]) is CloudProvider.GCP
+    assert detect_provider({"value": []}) is None
+    assert detect_provider([]) is None
+
+
+def _mixed_inventory(rng: random.Random):
+    """Random inventory mixing the top-level keys of every supported format."""
+    items = [
+        AZURE_ITEM,
+        {"type": "AWS::S3::Bucket"},
+        {"assetType": "compute.googleapis.com/Instance"},
+        {"assetType": "storage.googleapis.com/Bucket", "type": "Microsoft.Storage/storageAccounts"},
+        {"name": "untyped"},
+        "not-an-object",
+    ]
+    if rng.random() < 0.15:
+        return rng.sample(items, rng.randint(0, 2))
+    keys = ["value", "resources", "Resources", "ResourceIdentifiers", "assets", "other"]
+    rng.shuffle(keys)
+    inventory = {}
+    for key in keys:
+        if rng.random() < 0.5:
+            continue
+        if key == "Resources":
+            inventory[key] = {
+                f"Res{i}": rng.choice([{"Type": "AWS::EC2::Instance"}, {"Type": "Custom::Thing"}, {"Properties": {}}])
+                for i in range(rng.randint(0, 3))
+            }
+        else:
+            inventory[key] = rng.sample(items, rng.randint(0, 2))
+    return inventory
+
+
+def test_detect_provider_stream_agrees_with_detect_provider():
+    pytest.importorskip("ijson")
+    rng = random.Random(0)
+    for _ in range(2000):
+        inventory = _mixed_inventory(rng)
+        streamed = detect_provider_stream(io.BytesIO(json.dumps(inventory).encode()))
+        assert streamed == detect_provider(inventory), inventory
+
+
+def _graph_summary(graph):
+    """Graph contents that do not depend on generated edge IDs or timestamps."""
+    data = graph.model_dump(mode="json")
+    edges = sorted(
+        (edge["source"], edge["target"], edge["edge_type"], edge["label"]) for edge in data["edges"]
+    )
+    return data["provider"], data["source"], data["nodes"], edges, data["metadata"]
+
+
+@pytest.mark.parametrize("fixture", ["aws_cloudformation.json", "gcp_assets.json"])
+def test_streaming_parsers_match_parse_inventory(fixture):
+    pytest.importorskip("ijson")
+    path = FIXTURES / fixture
+    expected = parse_inventory(json.loads(path.read_text()))
+    with path.open("rb") as fp:
+        streamed = parse_inventory(fp)
+    assert streamed.nodes, fixture
+    assert _graph_summary(streamed) == _graph_summary(expected)
+
+
+def _node(node_id, service_type="virtual_machine", category=None, label=None, parent_id=None, **properties):
+    return InfraNode(
+        id=node_id,
+        provider=CloudProvider.AZURE,
+        service_type=service_type,
+        label=label or node_id,
+        parent_id=parent_id,
+        category=category,
+        properties=properties,
+    )
+
+
+def _edge_set(edges):
+    return {(edge.source, edge.target, edge.edge_type, edge.label) for edge in edges}
+
+
+def test_infer_edges():
+    nodes = [
+        _node("rg-app", "resource_group"),
+        _node("web", parent_id="rg-app", subnetId="s1", storageAccountId="st1", connectionString="Server=orders-db"),
+        _node("api", parent_id="rg-missing", subnetId="s1", database="orders-db"),
+        _node("st1", "storage_account", subnetId=["unhashable"]),
+        _node("cache", subnetId=["unhashable"]),
+        _node("db", "sql_database", category="Database", label="Orders-DB"),
+    ]
+    edges = _infer_edges(nodes, CloudProvider.AZURE)
+    assert _edge_set(edges) == {
+        ("rg-app", "web", "contains", "contains"),
+        ("api", "web", "network", "same subnet"),
+        ("cache", "st1", "network", "same subnet"),
+        ("web", "st1", "data", "uses storage"),
+        ("web", "db", "data", "database connection"),
+        ("api", "db", "data", "database connection"),
+    }
+    assert len(edges) == len(_edge_set(edges))
+    assert all(type(edge.edge_type) is str for edge in edges)
+
+
+def test_parsed_graphs_store_plain_enum_values():
+    graph = parse_inventory(json.loads((FIXTURES / "aws_cloudformation.json").read_text()))
+    data = graph.model_dump()
+    assert data["provider"] == "aws"
+    assert {node["provider"] for node in data["nodes"]} == {"aws"}
+    assert {type(edge["edge_type"]) for edge in data["edges"]} == {str}
@@ -0,0 +1,120 @@
+"""Tests for MCP tool initialization, backoff and cancellation in app.deps."""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import deps
+
+
+class FakeTool:
+    """Stand-in for MCPStreamableHTTPTool whose session enter is scripted per test."""
+
+    instances = []
+
+    def __init__(self, name, url):
+        self.name = name
+        self.url = url
+        self.exited = False
+        FakeTool.instances.append(self)
+
+    async def __aenter__(self):
+        await FakeTool.enter()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.exited = True
+
+    @staticmethod
+    async def enter():
+        return None
+
+
+@pytest.fixture
+def docs_state(monkeypatch):
+    """Fresh Microsoft Learn MCP state pointing at a fake endpoint."""
+    state = deps.ToolState()
+    monkeypatch.setitem(deps._tools, deps.DOCS_SPEC.key, state)
+    monkeypatch.setattr(deps, "get_settings", lambda: SimpleNamespace(MICROSOFT_LEARN_MCP_URL="http://mcp.test"))
+    monkeypatch.setattr(deps, "_MCP_AVAILABLE", True)
+    monkeypatch.setattr(deps, "MCPStreamableHTTPTool", FakeTool)
+    monkeypatch.setattr(FakeTool, "instances", [])
+    return state
+
+
+def test_cancelling_initialization_propagates_without_backoff(docs_state, monkeypatch):
+    async def hang():
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(FakeTool, "enter", staticmethod(hang))
+
+    async def run():
+        task = asyncio.create_task(deps.get_microsoft_docs_mcp_tool())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert docs_state.tool is None
+    assert docs_state.backoff_until is None
+    assert docs_state.attempts == 0
+
+
+def test_transport_cancelled_error_falls_back_with_backoff(docs_state, monkeypatch):
+    async def transport_cancelled():
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(FakeTool, "enter", staticmethod(transport_cancelled))
+
+    assert asyncio.run(deps.get_microsoft_docs_mcp_tool()) is None
+    assert docs_state.tool is None
+    assert docs_state.backoff_until is not None
+    assert docs_state.attempts == 1
+
+
+def test_failed_initialization_backs_off_and_skips_retries(docs_state, monkeypatch):
+    async def refuse():
+        raise ConnectionError("refused")
+
+    monkeypatch.setattr(FakeTool, "enter", staticmethod(refuse))
+    # Always take the top of the jitter window
+    monkeypatch.setattr(deps.random, "uniform", lambda low, high: high)
+
+    assert asyncio.run(deps.get_microsoft_docs_mcp_tool()) is None
+    assert docs_state.attempts == 1
+    first_delay = docs_state.backoff_until - deps.time.monotonic()
+    assert 0 < first_delay <= deps._BACKOFF_BASE_SECONDS
+
+    # Still backing off: no new connection attempt
+    assert asyncio.run(deps.get_microsoft_docs_mcp_tool()) is None
+    assert len(FakeTool.instances) == 1
+    assert docs_state.attempts == 1
+
+
+def test_backoff_grows_exponentially_up_to_the_cap(monkeypatch):
+    monkeypatch.setattr(deps.random, "uniform", lambda low, high: high)
+    state = deps.ToolState()
+    delays = [deps._next_backoff(state, ConnectionError()) for _ in range(10)]
+    assert delays[:3] == [deps._BACKOFF_BASE_SECONDS * 2 ** n for n in range(3)]
+    assert max(delays) == deps._BACKOFF_CAP_SECONDS
+    assert state.attempts == 10
+
+
+def test_successful_initialization_publishes_tool_and_resets_backoff(docs_state):
+    docs_state.attempts = 3
+    tool = asyncio.run(deps.get_microsoft_docs_mcp_tool())
+    assert isinstance(tool, FakeTool)
+    assert docs_state.tool is tool
+    assert docs_state.exit_stack is not None
+    assert docs_state.backoff_until is None
+    assert docs_state.attempts == 0
+    # Later calls reuse the open session
+    assert asyncio.run(deps.get_microsoft_docs_mcp_tool()) is tool
+    assert len(FakeTool.instances) == 1
@@ -0,0 +1,128 @@
+"""Tests for the GCP→Azure and AWS→Azure diagram migrations."""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add backend to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.iac_generators.aws_migration import AWS_TO_AZURE_SERVICE_CATALOG, migrate_aws_diagram
+from app.iac_generators.gcp_migration import GCP_TO_AZURE_MAPPINGS, migrate_gcp_diagram
+
+
+def _diagram(*nodes):
+    return {"nodes": list(nodes), "edges": [], "name": "test"}
+
+
+def _node(node_id, **data):
+    return {"id": node_id, "position": {"x": 0, "y": 0}, "data": data}
+
+
+def _azure_services(result):
+    return {row["node_id"]: row["azure_service"] for row in result.converted_nodes}
+
+
+@pytest.mark.parametrize(
+    "title, azure_service",
+    [
+        # Names contained in a catalog key resolve in catalog order
+        ("NAT", "NAT Gateway"),
+        ("engine", "Virtual Machine"),
+        ("api", "Computer Vision"),
+        # Catalog keys contained in the name resolve longest key first
+        ("Cloud SQL on GCE", "Azure SQL Database"),
+        ("Compute Engine", "Virtual Machine"),
+    ],
+)
+def test_gcp_title_resolution(title, azure_service):
+    result = migrate_gcp_diagram(_diagram(_node("n", title=title)))
+    assert _azure_services(result) == {"n": azure_service}
+
+
+@pytest.mark.parametrize(
+    "service_type, azure_service",
+    [
+        ("vpc", "Virtual Network"),
+        ("subnet", "Virtual Network"),
+        ("external_ip", "Virtual Network"),
+        ("cloud_kms", "Azure Key Vault"),
+    ],
+)
+def test_gcp_service_type_mapping(service_type, azure_service):
+    result = migrate_gcp_diagram(_diagram(_node("n", title="imported", serviceType=service_type)))
+    assert _azure_services(result) == {"n": azure_service}
+
+
+def test_gcp_skips_nodes_tagged_with_another_provider():
+    diagram = _diagram(
+        _node("azure", title="Compute Engine", provider="azure"),
+        _node("aws", title="Compute Engine", provider="AWS"),
+        _node("gcp", title="Compute Engine", provider=" GCP "),
+        _node("untagged", title="Compute Engine"),
+        _node("unknown", title="Mystery Service", provider="gcp"),
+    )
+    before = copy.deepcopy(diagram)
+    result = migrate_gcp_diagram(diagram)
+
+    assert diagram == before
+    assert set(_azure_services(result)) == {"gcp", "untagged"}
+    assert [row["node_id"] for row in result.unmapped_services] == ["unknown"]
+    nodes = {node["id"]: node for node in result.diagram["nodes"]}
+    assert nodes["azure"] == before["nodes"][0]
+    assert nodes["aws"] == before["nodes"][1]
+    assert nodes["gcp"]["data"]["provider"] == "azure"
+    assert nodes["gcp"]["data"]["gcpOriginal"]["title"] == "Compute Engine"
+    assert "Unmapped" in nodes["unknown"]["data"]["badges"]
+
+
+def test_gcp_cost_totals_are_exact():
+    # Totals are summed in whole cents, so fractional per-node prices add up exactly
+    nodes = [_node(f"fn{i}", title="Cloud Functions", provider="gcp") for i in range(10)]
+    summary = migrate_gcp_diagram(_diagram(*nodes)).cost_summary
+    assert summary["gcp_monthly_total"] == 4.0
+    assert summary["azure_monthly_total"] == 2.0
+    assert summary["delta"] == -2.0
+    assert summary["currency"] == "USD"
+
+
+def test_gcp_empty_diagram():
+    result = migrate_gcp_diagram(None)
+    assert not result.applied
+    assert result.converted_nodes == []
+
+
+def test_aws_migration_outputs():
+    diagram = _diagram(
+        _node("vm", title="Amazon EC2", provider="aws"),
+        _node("fn", title="Lambda"),
+        _node("bucket", title="imported", serviceType="object_storage"),
+        _node("unknown", title="Mystery Service", provider="aws"),
+    )
+    before = copy.deepcopy(diagram)
+    result = migrate_aws_diagram(diagram)
+
+    assert diagram == before
+    assert result.applied
+    services = _azure_services(result)
+    assert services["vm"] == "Azure Virtual Machine"
+    assert services["fn"] == "Azure Functions"
+    assert "bucket" in services
+    assert [row["node_id"] for row in result.unmapped_services] == ["unknown"]
+    assert [row["node_id"] for row in result.price_summary] == ["vm", "fn", "bucket"]
+
+    summary = result.cost_summary
+    aws_total = sum(row["aws_monthly"] for row in result.price_summary)
+    azure_total = sum(row["azure_monthly"] for row in result.price_summary)
+    assert summary["aws_monthly_total"] == pytest.approx(aws_total)
+    assert summary["azure_monthly_total"] == pytest.approx(azure_total)
+    assert summary["delta"] == pytest.approx(azure_total - aws_total)
+
+
+def test_catalogs_expose_only_documented_fields():
+    for entry in GCP_TO_AZURE_MAPPINGS.values():
+        assert not [key for key in entry if key.startswith("_")]
+    for entry in AWS_TO_AZURE_SERVICE_CATALOG:
+        assert not [key for key in entry if key.startswith("_")]